@@ -1,6 +1,11 @@
 from django.contrib import admin
-from .models import Project, ProposalUtility
+from .models import Project, ProposalUtility, QuotaBucket, RateAnalytics, Tariff, TariffVersion, UtilityCell
 
 # Register the models
 admin.site.register(Project)
 admin.site.register(ProposalUtility)
+admin.site.register(Tariff)
+admin.site.register(RateAnalytics)
+admin.site.register(UtilityCell)
+admin.site.register(TariffVersion)
+admin.site.register(QuotaBucket)
@@ -0,0 +1,3 @@
+from .runner import BenchmarkRunner, compare_results, load_fixture, FIXTURE_NAMES
+
+__all__ = ['BenchmarkRunner', 'compare_results', 'load_fixture', 'FIXTURE_NAMES']
@@ -0,0 +1,208 @@
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+import django
+import requests
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+
+from ..services.rate_calculator import RateCalculator
+from ..services.rate_processor import RateProcessor
+from ..services.rate_provider import OpenEIRateProvider
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+FIXTURE_NAMES = ['small', 'typical', 'seasonal_tou_50']
+# Cached OpenEI responses, dropped before each view call so it fetches and processes tariffs
+TARIFF_CACHE_PREFIX = 'openei:'
+
+class BenchmarkCache(LocMemCache):
+    """Process-local cache whose entries can be dropped by key prefix"""
+
+    def delete_prefix(self, prefix: str) -> None:
+        stored_prefix = self.make_key(prefix)
+        with self._lock:
+            for key in [key for key in self._cache if key.startswith(stored_prefix)]:
+                self._delete(key)
+
+# Runs never read or flush the configured cache
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'app.benchmarks.runner.BenchmarkCache',
+        'LOCATION': 'solarate-benchmark',
+    }
+}
+
+def load_fixture(name: str) -> bytes:
+    """Return the raw OpenEI response body for a recorded fixture"""
+    return (FIXTURES_DIR / f'{name}.json').read_bytes()
+
+@contextmanager
+def replay_openei(body: bytes):
+    """Answer every outgoing HTTP request with the given OpenEI response body"""
+    def send(adapter, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers['Content-Type'] = 'application/json'
+        response.url = request.url
+        response.request = request
+        return response
+
+    with mock.patch('requests.adapters.HTTPAdapter.send', send):
+        yield
+
+class BenchmarkRunner:
+    """
+    Replays recorded OpenEI responses through each stage of the rate
+    pipeline and through the full view, recording timings and peak memory
+    """
+
+    def __init__(self, iterations: int = 20, consumption: float = 6000, escalator: float = 5):
+        self.iterations = iterations
+        self.consumption = consumption
+        self.escalator = escalator
+
+    def run(self, fixtures: List[str] = None, client=None) -> Dict:
+        """
+        Benchmark every fixture; the full-view stage runs only when a
+        logged-in django.test.Client is supplied
+        """
+        results = {}
+        for name in fixtures or FIXTURE_NAMES:
+            results[name] = self.run_fixture(name, client)
+
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'iterations': self.iterations,
+                'consumption': self.consumption,
+                'escalator': self.escalator,
+                'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'results': results,
+        }
+
+    def run_fixture(self, name: str, client=None) -> Dict:
+        with override_settings(CACHES=BENCHMARK_CACHES):
+            # Cached responses from a previous fixture would be served to the view
+            cache.clear()
+            return self._run_fixture(name, client)
+
+    def _run_fixture(self, name: str, client=None) -> Dict:
+        body = load_fixture(name)
+        provider = OpenEIRateProvider('benchmark')
+        processor = RateProcessor()
+        calculator = RateCalculator()
+        daily_consumption = self.consumption / 365
+
+        with replay_openei(body):
+            raw_rates = provider.get_utility_rates('benchmark address')
+            rates = processor.process_rate_data(raw_rates)
+            selected = next((r for r in rates if r['is_default']), rates[0])
+
+            def calculate():
+                calculator.calculate_yearly_cost(selected, self.consumption, self.escalator)
+                calculator.calculate_average_rate(
+                    selected['energyratestructure'], selected['energyweekdayschedule'], daily_consumption
+                )
+                calculator.calculate_daily_cost(
+                    selected['energyratestructure'], selected['energyweekdayschedule'], daily_consumption
+                )
+
+            def analyze():
+                for rate in rates:
+                    calculator.calculate_average_rate(
+                        rate['energyratestructure'], rate['energyweekdayschedule'], daily_consumption
+                    )
+                    calculator.calculate_daily_cost(
+                        rate['energyratestructure'], rate['energyweekdayschedule'], daily_consumption
+                    )
+
+            stages = {
+                'provider': self.measure(lambda: provider.get_utility_rates('benchmark address')),
+                'processor': self.measure(lambda: processor.process_rate_data(raw_rates)),
+                'calculator': self.measure(calculate),
+                'rate_analysis': self.measure(analyze),
+            }
+            if client is not None:
+                payload = {
+                    'address': 'benchmark address',
+                    'consumption': self.consumption,
+                    'escalator': self.escalator,
+                }
+                # Without the drop every call after warm-up would be a cache hit
+                stages['view'] = self.measure(
+                    lambda: self._post_view(client, payload),
+                    setup=lambda: cache.delete_prefix(TARIFF_CACHE_PREFIX)
+                )
+
+            return {
+                'tariffs': len(rates),
+                'stages': stages,
+            }
+
+    def measure(self, func: Callable, setup: Optional[Callable] = None) -> Dict:
+        """
+        Time func over the configured iterations, then measure its peak memory
+        once; setup runs untimed before every call
+        """
+        setup = setup or (lambda: None)
+        setup()
+        func()  # warm-up
+        timings = []
+        for _ in range(self.iterations):
+            setup()
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+
+        setup()
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            'min_ms': round(timings[0], 4),
+            'median_ms': round(statistics.median(timings), 4),
+            'mean_ms': round(statistics.fmean(timings), 4),
+            'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    @staticmethod
+    def _post_view(client, payload: Dict):
+        response = client.post('/api/utility-rates/', payload, content_type='application/json')
+        if response.status_code != 200:
+            raise RuntimeError(f"View returned {response.status_code}: {response.content[:200]}")
+
+def compare_results(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Return a message for every stage whose median slowed down by more than
+    threshold percent against the baseline
+    """
+    regressions = []
+    for fixture, fixture_result in current['results'].items():
+        baseline_stages = baseline.get('results', {}).get(fixture, {}).get('stages', {})
+        for stage, timing in fixture_result['stages'].items():
+            previous = baseline_stages.get(stage)
+            if not previous or previous['median_ms'] <= 0:
+                continue
+            change = (timing['median_ms'] - previous['median_ms']) / previous['median_ms'] * 100
+            if change > threshold:
+                regressions.append(
+                    f"{fixture}/{stage}: {previous['median_ms']:.3f}ms -> "
+                    f"{timing['median_ms']:.3f}ms (+{change:.1f}%)"
+                )
+    return regressions
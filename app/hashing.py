@@ -0,0 +1,12 @@
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(value: Any) -> str:
+    """
+    Return a stable SHA-256 hex digest for a JSON-serializable value
+    Keys are sorted so logically equal structures always hash the same
+    """
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
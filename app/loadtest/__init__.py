@@ -0,0 +1,4 @@
+from .openei_stub import OpenEIStubServer
+from .driver import LoadDriver, LoadResult
+
+__all__ = ['OpenEIStubServer', 'LoadDriver', 'LoadResult']
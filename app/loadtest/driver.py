@@ -0,0 +1,121 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+@dataclass
+class LoadResult:
+    """Latencies and status codes collected at one concurrency level"""
+    endpoint: str
+    concurrency: int
+    elapsed: float
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def errors(self) -> int:
+        return sum(count for status, count in self.statuses.items() if not status.startswith('2'))
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile in milliseconds"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index] * 1000
+
+class LoadDriver:
+    """
+    Fires requests at an endpoint from a pool of worker threads
+
+    With credentials each worker logs in once through the admin login form
+    and reuses the session, because HTTP Basic auth would re-hash the
+    password on every request and dominate the measured latency.
+    Set basic_auth to send credentials on every request instead.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 auth: Optional[Tuple[str, str]] = None,
+                 basic_auth: bool = False,
+                 timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.auth = auth
+        self.basic_auth = basic_auth
+        self.timeout = timeout
+        self._sessions: queue.Queue = queue.Queue()
+        self._session_count = 0
+
+    def run(self,
+            endpoint: str,
+            path: str,
+            payload_factory: Callable[[int], dict],
+            concurrency: int,
+            total_requests: int) -> LoadResult:
+        result = LoadResult(endpoint=endpoint, concurrency=concurrency, elapsed=0.0)
+        lock = threading.Lock()
+
+        # Sessions are opened (and logged in) before timing starts
+        while self._session_count < concurrency:
+            self._sessions.put(self._open_session())
+            self._session_count += 1
+
+        def send(index: int):
+            session = self._sessions.get()
+            started = time.perf_counter()
+            try:
+                response = session.post(
+                    f"{self.base_url}{path}",
+                    json=payload_factory(index),
+                    timeout=self.timeout
+                )
+                status = str(response.status_code)
+            except requests.RequestException as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - started
+            self._sessions.put(session)
+            with lock:
+                result.latencies.append(elapsed)
+                result.statuses[status] = result.statuses.get(status, 0) + 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(send, range(total_requests)))
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _open_session(self) -> requests.Session:
+        """Keep-alive session, authenticated when credentials were given"""
+        session = requests.Session()
+        if self.auth and self.basic_auth:
+            session.auth = self.auth
+        elif self.auth:
+            self._login(session)
+        return session
+
+    def _login(self, session: requests.Session):
+        login_url = f"{self.base_url}/admin/login/"
+        session.get(login_url, timeout=self.timeout)
+        response = session.post(
+            login_url,
+            data={
+                'username': self.auth[0],
+                'password': self.auth[1],
+                'csrfmiddlewaretoken': session.cookies.get('csrftoken', ''),
+                'next': '/admin/',
+            },
+            headers={'Referer': login_url},
+            timeout=self.timeout
+        )
+        if 'sessionid' not in session.cookies:
+            raise RuntimeError(f"Login failed for {self.auth[0]} (status {response.status_code}), staff access is required")
+        # DRF enforces CSRF for session-authenticated requests
+        session.headers['X-CSRFToken'] = session.cookies.get('csrftoken', '')
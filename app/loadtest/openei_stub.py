@@ -0,0 +1,118 @@
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from ..benchmarks.runner import load_fixture
+
+logger = logging.getLogger(__name__)
+
+class OpenEIStubServer:
+    """
+    Local stand-in for the OpenEI utility rates API that serves recorded
+    payloads with configurable latency, error rate and 429 throttling.
+    POSTs are acknowledged so it can double as the webhook receiver.
+    """
+
+    def __init__(self,
+                 fixtures: List[str],
+                 host: str = '127.0.0.1',
+                 port: int = 8765,
+                 latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0,
+                 error_rate: float = 0.0,
+                 rate_limit: Optional[float] = None):
+        self.bodies = [load_fixture(name) for name in fixtures]
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self._tokens = rate_limit or 0.0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/utility_rates"
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def start(self) -> threading.Thread:
+        """Serve from a background thread, returns the thread"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def select_body(self, query: dict) -> bytes:
+        """Pick a payload deterministically so each address always gets the same tariffs"""
+        key = (query.get('address') or query.get('ei') or query.get('getpage') or [''])[0]
+        return self.bodies[zlib.crc32(key.encode('utf-8')) % len(self.bodies)]
+
+    def take_token(self) -> bool:
+        """Token bucket enforcing rate_limit requests per second"""
+        if not self.rate_limit:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def delay(self):
+        latency = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if not stub.take_token():
+                    self._send(429, json.dumps({'error': 'rate limited'}).encode(), {'Retry-After': '1'})
+                    return
+
+                stub.delay()
+                if stub.error_rate and random.random() < stub.error_rate:
+                    self._send(500, json.dumps({'error': 'upstream error'}).encode())
+                    return
+
+                query = parse_qs(urlparse(self.path).query)
+                self._send(200, stub.select_body(query))
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.rfile.read(length)
+                self._send(200, b'{"ok":true}')
+
+            def _send(self, status: int, body: bytes, headers: dict = None):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        return Handler
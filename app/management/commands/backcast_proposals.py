@@ -0,0 +1,94 @@
+import bisect
+import csv
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from django.core.management.base import BaseCommand
+
+from app.models import ProposalUtility, TariffVersion
+from app.services.input_validator import InputValidator
+from app.services.rate_calculator import RateCalculator
+from app.services.rate_processor import RateProcessor
+
+BACKCAST_FIELDS = [
+    'proposal_id', 'project_id', 'openei_id', 'as_of', 'version_startdate',
+    'stored_first_year_cost', 'backcast_first_year_cost',
+]
+
+
+class Command(BaseCommand):
+    help = "Price stored proposals with the tariff revision in effect on their quote date"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--openei-id', help="Only proposals on this tariff")
+        parser.add_argument('--as-of', help="Price every proposal as of this date (YYYY-MM-DD) instead of its quote date")
+        parser.add_argument('--output', default='-', help="CSV file path, '-' for stdout")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        as_of = InputValidator.parse_as_of(options['as_of']) if options['as_of'] else None
+        self.processor = RateProcessor()
+        self.calculator = RateCalculator()
+        # label -> (sorted start dates, versions), loaded once per tariff
+        self.versions: Dict[str, Tuple[List, List[TariffVersion]]] = {}
+        self.rates: Dict[int, Optional[Dict]] = {}
+
+        proposals = ProposalUtility.objects.select_related('project').order_by('id')
+        if options['openei_id']:
+            proposals = proposals.filter(openei_id=options['openei_id'])
+
+        output = sys.stdout if options['output'] == '-' else open(options['output'], 'w', newline='', encoding='utf-8')
+        written = 0
+        missing = 0
+        try:
+            writer = csv.DictWriter(output, fieldnames=BACKCAST_FIELDS)
+            writer.writeheader()
+            for proposal in proposals.iterator(chunk_size=2000):
+                effective_at = as_of or proposal.project.created_at
+                version = self._version_of(proposal.openei_id, effective_at)
+                rate_info = self._rate_info(version, effective_at) if version else None
+                if rate_info is None:
+                    missing += 1
+                    continue
+
+                writer.writerow({
+                    'proposal_id': proposal.id,
+                    'project_id': proposal.project_id,
+                    'openei_id': proposal.openei_id,
+                    'as_of': effective_at.date().isoformat(),
+                    'version_startdate': version.startdate.date().isoformat(),
+                    'stored_first_year_cost': proposal.first_year_cost,
+                    'backcast_first_year_cost': self.calculator.calculate_yearly_cost(
+                        rate_info, proposal.project.consumption, proposal.project.percentage
+                    )[0],
+                })
+                written += 1
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(self.style.SUCCESS(
+            f"Back-cast {written} proposals, {missing} had no stored revision for their date, in {elapsed:.1f}s"
+        ))
+
+    def _version_of(self, label: str, effective_at) -> Optional[TariffVersion]:
+        """Binary search the tariff's revisions for the latest one started by effective_at"""
+        if label not in self.versions:
+            versions = list(TariffVersion.objects.filter(label=label).order_by('startdate'))
+            self.versions[label] = ([version.startdate for version in versions], versions)
+
+        startdates, versions = self.versions[label]
+        index = bisect.bisect_right(startdates, effective_at) - 1
+        if index < 0:
+            return None
+        version = versions[index]
+        if version.enddate and version.enddate <= effective_at:
+            return None
+        return version
+
+    def _rate_info(self, version: TariffVersion, effective_at) -> Optional[Dict]:
+        if version.id not in self.rates:
+            rates = self.processor.process_rate_data({'items': [version.item]}, effective_at)
+            self.rates[version.id] = rates[0] if rates else None
+        return self.rates[version.id]
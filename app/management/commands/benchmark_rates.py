@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks import BenchmarkRunner, FIXTURE_NAMES, compare_results
+
+DEFAULT_BASELINE = Path(__file__).resolve().parents[2] / 'benchmarks' / 'baseline.json'
+
+
+class Command(BaseCommand):
+    help = "Benchmark the rate pipeline against recorded OpenEI responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fixture', action='append', choices=FIXTURE_NAMES,
+                            help="Fixture to replay, may be repeated (default: all)")
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--output', help="Write results as JSON to this path")
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+        parser.add_argument('--save-baseline', action='store_true',
+                            help="Store these results as the new baseline")
+        parser.add_argument('--threshold', type=float, default=20.0,
+                            help="Allowed median slowdown in percent before failing")
+        parser.add_argument('--skip-view', action='store_true',
+                            help="Skip the full view stage, which needs a test database")
+
+    def handle(self, *args, **options):
+        runner = BenchmarkRunner(iterations=options['iterations'])
+
+        if options['skip_view']:
+            results = runner.run(options['fixture'])
+        else:
+            results = self._run_with_view(runner, options['fixture'])
+
+        self._print_results(results)
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2))
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            baseline_path.write_text(json.dumps(results, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {baseline_path}"))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(f"No baseline at {baseline_path}, run with --save-baseline to create one")
+            return
+
+        regressions = compare_results(results, json.loads(baseline_path.read_text()), options['threshold'])
+        if regressions:
+            for message in regressions:
+                self.stderr.write(message)
+            raise CommandError(f"{len(regressions)} stage(s) regressed more than {options['threshold']}%")
+        self.stdout.write(self.style.SUCCESS(f"No regressions above {options['threshold']}%"))
+
+    def _run_with_view(self, runner: BenchmarkRunner, fixtures):
+        """Run inside a throwaway test database so the view can save projects"""
+        setup_test_environment()
+        test_runner = DiscoverRunner(verbosity=0)
+        old_config = test_runner.setup_databases()
+        try:
+            user = User.objects.create_user(username='benchmark', password='benchmark')
+            client = Client()
+            client.force_login(user)
+            return runner.run(fixtures, client)
+        finally:
+            test_runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+    def _print_results(self, results):
+        for fixture, fixture_result in results['results'].items():
+            self.stdout.write(f"{fixture} ({fixture_result['tariffs']} tariffs)")
+            for stage, timing in fixture_result['stages'].items():
+                self.stdout.write(
+                    f"  {stage:<14} median {timing['median_ms']:>9.3f}ms  "
+                    f"p95 {timing['p95_ms']:>9.3f}ms  peak {timing['peak_kb']:>8.1f}KB"
+                )
@@ -0,0 +1,112 @@
+import csv
+import json
+import sys
+import time
+from django.core.management.base import BaseCommand
+
+from app.models import Project
+
+EXPORT_FIELDS = [
+    'username', 'name', 'description', 'address', 'consumption', 'percentage',
+    'selected_rate', 'created_at', 'openei_id', 'rate_name', 'utility',
+    'average_rate', 'first_year_cost', 'tariff_hash', 'tariff_label', 'pricing_matrix',
+]
+
+
+class Command(BaseCommand):
+    help = "Stream projects and their utility proposals to CSV or NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=['csv', 'ndjson'], default='ndjson')
+        parser.add_argument('--output', default='-', help="Output file path, '-' for stdout")
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        output = sys.stdout if options['output'] == '-' else open(options['output'], 'w', newline='', encoding='utf-8')
+        try:
+            written = self._export(output, options['format'], options['chunk_size'], started)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        elapsed = time.perf_counter() - started
+        self.stderr.write(self.style.SUCCESS(
+            f"Exported {written} projects in {elapsed:.1f}s ({self._rate(written, elapsed):.0f} rows/s)"
+        ))
+
+    def _export(self, output, fmt: str, chunk_size: int, started: float) -> int:
+        projects = (
+            Project.objects
+            .select_related('user', 'proposal', 'proposal__tariff')
+            .order_by('id')
+            .iterator(chunk_size=chunk_size)
+        )
+
+        writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS) if fmt == 'csv' else None
+        if writer:
+            writer.writeheader()
+
+        # Each tariff structure is written once, later rows only reference its hash
+        seen_tariffs = set()
+        written = 0
+
+        for project in projects:
+            row = self._serialize(project, seen_tariffs)
+            if writer:
+                row['pricing_matrix'] = json.dumps(row['pricing_matrix']) if row['pricing_matrix'] is not None else ''
+                writer.writerow(row)
+            else:
+                output.write(json.dumps(row) + '\n')
+
+            written += 1
+            if written % chunk_size == 0:
+                elapsed = time.perf_counter() - started
+                self.stderr.write(f"Exported {written} projects ({self._rate(written, elapsed):.0f} rows/s)")
+
+        return written
+
+    def _serialize(self, project: Project, seen_tariffs: set) -> dict:
+        row = {
+            'username': project.user.username,
+            'name': project.name,
+            'description': project.description,
+            'address': project.address,
+            'consumption': project.consumption,
+            'percentage': project.percentage,
+            'selected_rate': project.selected_rate,
+            'created_at': project.created_at.isoformat(),
+            'openei_id': None,
+            'rate_name': None,
+            'utility': None,
+            'average_rate': None,
+            'first_year_cost': None,
+            'tariff_hash': None,
+            'tariff_label': None,
+            'pricing_matrix': None,
+        }
+
+        proposal = getattr(project, 'proposal', None)
+        if proposal is None:
+            return row
+
+        row.update({
+            'openei_id': proposal.openei_id,
+            'rate_name': proposal.rate_name,
+            'utility': proposal.utility,
+            'average_rate': proposal.average_rate,
+            'first_year_cost': proposal.first_year_cost,
+        })
+
+        tariff = proposal.tariff
+        if tariff is not None:
+            row['tariff_hash'] = tariff.content_hash
+            row['tariff_label'] = tariff.label
+            if tariff.content_hash not in seen_tariffs:
+                seen_tariffs.add(tariff.content_hash)
+                row['pricing_matrix'] = tariff.structure
+
+        return row
+
+    @staticmethod
+    def _rate(count: int, elapsed: float) -> float:
+        return count / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,218 @@
+import csv
+import json
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from app.models import Project, ProposalUtility, Tariff
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.services.input_validator import InputValidator
+
+
+class Command(BaseCommand):
+    help = "Stream projects and utility proposals from CSV or NDJSON into the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File written by export_projects")
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help="Defaults to the file extension")
+        parser.add_argument('--user', help="Username for rows whose user does not exist")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.endswith('.csv') else 'ndjson')
+        self.batch_size = options['batch_size']
+        self.validator = InputValidator()
+        self.users: Dict[str, Optional[User]] = {}
+        self.tariffs: Dict[str, Optional[int]] = {}
+        self.unresolved = 0
+        self.fallback_user = self._get_user(options['user']) if options['user'] else None
+        if options['user'] and self.fallback_user is None:
+            raise CommandError(f"User {options['user']} does not exist")
+
+        started = time.perf_counter()
+        imported = 0
+        skipped = 0
+        batch: List[Dict] = []
+
+        with open(path, newline='', encoding='utf-8') as source:
+            for line_number, row, error in self._read_rows(source, fmt):
+                # Structures are written once per tariff, so register them even from rows that are skipped
+                if row is not None:
+                    self._register_tariff(row)
+                error = error or self._validate(row)
+                if error:
+                    skipped += 1
+                    self.stderr.write(f"Line {line_number}: {error}")
+                    continue
+
+                row['line_number'] = line_number
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    imported += self._write_batch(batch)
+                    batch = []
+                    self._report_progress(imported, started)
+
+        if batch:
+            imported += self._write_batch(batch)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} projects, skipped {skipped}, {self.unresolved} without a tariff, "
+            f"in {elapsed:.1f}s ({self._rate(imported, elapsed):.0f} rows/s)"
+        ))
+
+    def _read_rows(self, source, fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+        """Yield (line number, row, error), with row None when the line cannot be parsed"""
+        if fmt == 'csv':
+            # Header is line 1, so data rows start at line 2
+            for line_number, row in enumerate(csv.DictReader(source), start=2):
+                row = {key: (value if value != '' else None) for key, value in row.items()}
+                if row.get('pricing_matrix'):
+                    try:
+                        row['pricing_matrix'] = json.loads(row['pricing_matrix'])
+                    except ValueError:
+                        row['pricing_matrix'] = None
+                        yield line_number, row, "pricing_matrix is not valid JSON"
+                        continue
+                yield line_number, row, None
+            return
+
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Line is not valid JSON"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Line is not a JSON object"
+                continue
+            yield line_number, row, None
+
+    def _validate(self, row: Dict) -> Optional[str]:
+        try:
+            row['consumption'] = float(row.get('consumption') or 0)
+            row['percentage'] = float(row.get('percentage') or 0)
+        except (TypeError, ValueError):
+            return "Consumption and percentage must be numbers"
+
+        try:
+            row['average_rate'] = float(row.get('average_rate') or 0)
+            row['first_year_cost'] = float(row.get('first_year_cost') or 0)
+        except (TypeError, ValueError):
+            return "average_rate and first_year_cost must be numbers"
+
+        if row.get('created_at'):
+            try:
+                row['created_at'] = datetime.fromisoformat(row['created_at'])
+            except (TypeError, ValueError):
+                return "created_at must be an ISO 8601 timestamp"
+
+        validation_error = self.validator.validate_input(
+            row.get('address'), row['consumption'], row['percentage']
+        )
+        if validation_error:
+            return validation_error['error']
+
+        row['user'] = self._get_user(row.get('username')) or self.fallback_user
+        if row['user'] is None:
+            return f"Unknown user {row.get('username')} and no --user given"
+        return None
+
+    def _get_user(self, username: Optional[str]) -> Optional[User]:
+        if username not in self.users:
+            self.users[username] = User.objects.filter(username=username).first()
+        return self.users[username]
+
+    def _register_tariff(self, row: Dict):
+        """Store the structure a row carries for its tariff, if not known yet"""
+        content_hash = row.get('tariff_hash')
+        if not content_hash or self.tariffs.get(content_hash) or row.get('pricing_matrix') is None:
+            return
+        try:
+            tariff = Tariff.objects.get_or_create_for(
+                row.get('tariff_label') or row.get('openei_id') or '',
+                row['pricing_matrix']
+            )
+        except Exception as e:
+            self.stderr.write(f"Could not store tariff {content_hash}: {str(e)}")
+            return
+        self.tariffs[content_hash] = tariff.id
+
+    def _get_tariff_id(self, row: Dict) -> Optional[int]:
+        content_hash = row.get('tariff_hash')
+        if not content_hash:
+            return None
+
+        if not self.tariffs.get(content_hash):
+            tariff = Tariff.objects.filter(content_hash=content_hash).only('id').first()
+            if tariff is None:
+                return None
+            self.tariffs[content_hash] = tariff.id
+        return self.tariffs[content_hash]
+
+    @transaction.atomic
+    def _write_batch(self, rows: List[Dict]) -> int:
+        projects = Project.objects.bulk_create(
+            [
+                Project(
+                    user=row['user'],
+                    name=row.get('name') or '',
+                    description=row.get('description') or '',
+                    address=row['address'],
+                    consumption=row['consumption'],
+                    percentage=row['percentage'],
+                    selected_rate=row.get('selected_rate') or '',
+                )
+                for row in rows
+            ],
+            batch_size=self.batch_size
+        )
+
+        # created_at is auto_now_add, so exported timestamps are restored afterwards
+        dated = []
+        for project, row in zip(projects, rows):
+            if row.get('created_at'):
+                project.created_at = row['created_at']
+                dated.append(project)
+        if dated:
+            Project.objects.bulk_update(dated, ['created_at'], batch_size=self.batch_size)
+
+        proposals = []
+        for project, row in zip(projects, rows):
+            if not row.get('openei_id'):
+                continue
+            tariff_id = self._get_tariff_id(row)
+            if tariff_id is None and row.get('tariff_hash'):
+                self.unresolved += 1
+                self.stderr.write(
+                    f"Line {row['line_number']}: tariff {row['tariff_hash']} not found in the file or database, "
+                    f"proposal imported without its rate structure"
+                )
+            proposals.append(ProposalUtility(
+                project=project,
+                openei_id=row['openei_id'],
+                rate_name=row.get('rate_name') or '',
+                utility=row.get('utility') or '',
+                average_rate=row['average_rate'],
+                first_year_cost=row['first_year_cost'],
+                tariff_id=tariff_id,
+            ))
+        proposals = ProposalUtility.objects.bulk_create(proposals, batch_size=self.batch_size)
+
+        # bulk_create skips post_save, so analytics are updated per batch here
+        AnalyticsRepository.record(proposals)
+        return len(projects)
+
+    def _report_progress(self, imported: int, started: float):
+        elapsed = time.perf_counter() - started
+        self.stderr.write(f"Imported {imported} projects ({self._rate(imported, elapsed):.0f} rows/s)")
+
+    @staticmethod
+    def _rate(count: int, elapsed: float) -> float:
+        return count / elapsed if elapsed > 0 else 0.0
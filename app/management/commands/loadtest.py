@@ -0,0 +1,62 @@
+import random
+from django.core.management.base import BaseCommand, CommandError
+
+from app.loadtest import LoadDriver
+
+ENDPOINTS = {
+    'utility-rates': '/api/utility-rates/',
+    'projects': '/api/projects/',
+}
+
+
+class Command(BaseCommand):
+    help = "Drive concurrent load at the rate and project endpoints and report latency percentiles"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--endpoint', action='append', choices=list(ENDPOINTS),
+                            help="Endpoint to load, may be repeated (default: all)")
+        parser.add_argument('--concurrency', default='1,4,16',
+                            help="Comma separated concurrency levels")
+        parser.add_argument('--requests', type=int, default=200,
+                            help="Requests per endpoint and concurrency level")
+        parser.add_argument('--addresses', type=int, default=50,
+                            help="Number of distinct addresses to rotate through")
+        parser.add_argument('--username', help="Staff user to log in as")
+        parser.add_argument('--password')
+        parser.add_argument('--basic-auth', action='store_true',
+                            help="Send credentials on every request instead of logging in once")
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',') if level]
+        except ValueError:
+            raise CommandError("--concurrency must be a comma separated list of integers")
+
+        auth = (options['username'], options['password']) if options['username'] else None
+        driver = LoadDriver(options['base_url'], auth=auth, basic_auth=options['basic_auth'])
+        addresses = [f"{100 + i} Main Street Springfield, IL 62701" for i in range(options['addresses'])]
+
+        def payload(index: int) -> dict:
+            return {
+                'address': addresses[index % len(addresses)],
+                'consumption': random.randint(1000, 10000),
+                'escalator': random.choice([4, 5, 6, 7, 8, 9, 10]),
+                'name': f"Load test {index}",
+                'description': 'Generated by manage.py loadtest',
+            }
+
+        self.stdout.write(
+            f"{'endpoint':<14} {'conc':>5} {'reqs':>6} {'rps':>8} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+        )
+        for endpoint in options['endpoint'] or list(ENDPOINTS):
+            for concurrency in levels:
+                result = driver.run(endpoint, ENDPOINTS[endpoint], payload, concurrency, options['requests'])
+                self.stdout.write(
+                    f"{endpoint:<14} {concurrency:>5} {len(result.latencies):>6} {result.throughput:>8.1f} "
+                    f"{result.percentile(50):>9.1f} {result.percentile(95):>9.1f} "
+                    f"{result.percentile(99):>9.1f} {result.errors:>7}"
+                )
+                if result.errors:
+                    self.stdout.write(f"  statuses: {result.statuses}")
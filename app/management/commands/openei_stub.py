@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from app.benchmarks import FIXTURE_NAMES
+from app.loadtest import OpenEIStubServer
+
+
+class Command(BaseCommand):
+    help = "Serve recorded OpenEI payloads locally for offline load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--fixture', action='append', choices=FIXTURE_NAMES,
+                            help="Payload to serve, may be repeated (default: all)")
+        parser.add_argument('--latency-ms', type=float, default=0.0)
+        parser.add_argument('--jitter-ms', type=float, default=0.0)
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help="Fraction of requests answered with a 500")
+        parser.add_argument('--rate-limit', type=float,
+                            help="Requests per second before answering 429")
+
+    def handle(self, *args, **options):
+        stub = OpenEIStubServer(
+            fixtures=options['fixture'] or FIXTURE_NAMES,
+            host=options['host'],
+            port=options['port'],
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            error_rate=options['error_rate'],
+            rate_limit=options['rate_limit'],
+        )
+        self.stdout.write(f"Serving OpenEI stub at {stub.url}")
+        self.stdout.write(f"Set OPENEI_BASE_URL={stub.url} (and WEBHOOK_URL to the same host) to use it")
+        try:
+            stub.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stub.shutdown()
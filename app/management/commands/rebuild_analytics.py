@@ -0,0 +1,14 @@
+import time
+from django.core.management.base import BaseCommand
+
+from app.repositories.analytics_repository import AnalyticsRepository
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-utility and per-plan analytics totals from scratch"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        rows = AnalyticsRepository.rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} analytics rows in {elapsed:.2f}s"))
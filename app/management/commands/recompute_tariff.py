@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from app.models import ProposalUtility, Tariff
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.tariff_version_repository import TariffVersionRepository
+from app.services.quote_grid import QuoteGrid
+from app.services.rate_calculator import RateCalculator
+from app.services.rate_processor import RateProcessor
+from app.services.openei_quota import BULK, OpenEIQuota, quota_priority
+from app.services.rate_provider import OpenEIRateProvider
+
+# Set in each worker process by _init_worker
+_worker_rate: Optional[Dict] = None
+_worker_calculator: Optional[RateCalculator] = None
+
+
+def _init_worker(rate_info: Dict) -> None:
+    global _worker_rate, _worker_calculator
+    _worker_rate = rate_info
+    _worker_calculator = RateCalculator()
+
+
+def _cost_chunk(rows: List[Tuple[int, float, float]]) -> List[Tuple[int, float]]:
+    """Return (proposal id, first-year cost) for each (id, consumption, escalator)"""
+    return [
+        (proposal_id, _worker_calculator.calculate_yearly_cost(_worker_rate, consumption, escalator)[0])
+        for proposal_id, consumption, escalator in rows
+    ]
+
+
+class Command(BaseCommand):
+    help = "Recompute stored costs for every proposal on a tariff after the utility revises it"
+
+    def add_arguments(self, parser):
+        parser.add_argument('openei_id', help="Label of the revised tariff")
+        parser.add_argument('--tariff-file', help="OpenEI JSON for the new revision instead of fetching it")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--checkpoint', help="Defaults to recompute_<openei_id>.checkpoint")
+
+    def handle(self, *args, **options):
+        openei_id = options['openei_id']
+        chunk_size = options['chunk_size']
+        checkpoint_path = options['checkpoint'] or f"recompute_{openei_id}.checkpoint"
+
+        rate_info = self._load_rate(openei_id, options['tariff_file'])
+        tariff = Tariff.objects.get_or_create_for(openei_id, rate_info['energyratestructure'])
+        # Every proposal on the tariff shares its weighted average rate
+        average_rate = rate_info['avg_rate']
+
+        revision_key = self._revision_key(rate_info, tariff, average_rate)
+        last_id = self._read_checkpoint(checkpoint_path, revision_key)
+        pending = ProposalUtility.objects.filter(openei_id=openei_id, id__gt=last_id)
+        total = pending.count()
+        if last_id:
+            self.stdout.write(f"Resuming after proposal {last_id}, {total} left")
+
+        started = time.perf_counter()
+        updated = 0
+        # Workers only run the calculator, so close the connection rather than share it across fork
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options['workers'],
+            initializer=_init_worker,
+            initargs=(rate_info,)
+        ) as executor:
+            # Chunks are written in submission order, so the checkpoint only ever
+            # moves past finished work; the window bounds how much is held in memory
+            in_flight = deque()
+            for chunk in self._chunks(pending, chunk_size):
+                in_flight.append(executor.submit(_cost_chunk, chunk))
+                if len(in_flight) >= options['workers'] * 2:
+                    updated += self._finish_chunk(in_flight.popleft().result(), tariff, average_rate,
+                                                  checkpoint_path, revision_key)
+                    self._report_progress(updated, total, started)
+            while in_flight:
+                updated += self._finish_chunk(in_flight.popleft().result(), tariff, average_rate,
+                                                  checkpoint_path, revision_key)
+                self._report_progress(updated, total, started)
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed {updated} proposals on {openei_id} "
+            f"in {elapsed:.1f}s ({self._rate(updated, elapsed):.0f} rows/s)"
+        ))
+
+    def _load_rate(self, openei_id: str, tariff_file: Optional[str]) -> Dict:
+        if tariff_file:
+            with open(tariff_file, encoding='utf-8') as source:
+                api_data = json.load(source)
+            # Accept either a full API response or a single tariff item
+            if 'items' not in api_data:
+                api_data = {'items': [api_data]}
+        else:
+            provider = OpenEIRateProvider(settings.OPENEI_API_KEY, settings.OPENEI_BASE_URL, OpenEIQuota.from_settings())
+            with quota_priority(BULK):
+                api_data = provider.get_rate_by_label(openei_id)
+
+        TariffVersionRepository.index(api_data.get('items', []))
+        rates = [rate for rate in RateProcessor().process_rate_data(api_data) if rate['label'] == openei_id]
+        if not rates:
+            raise CommandError(f"No current revision of tariff {openei_id} found")
+        return rates[0]
+
+    def _chunks(self, queryset, chunk_size: int) -> Iterator[List[Tuple[int, float, float]]]:
+        # Keyset pagination, so reads never hold a cursor open across the chunk writes
+        rows = queryset.order_by('id').values_list('id', 'project__consumption', 'project__percentage')
+        last_id = 0
+        while True:
+            chunk = list(rows.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1][0]
+
+    def _finish_chunk(self, costs: List[Tuple[int, float]], tariff: Tariff, average_rate: float,
+                      checkpoint_path: str, revision_key: str) -> int:
+        self._write_chunk(costs, tariff, average_rate)
+        self._write_checkpoint(checkpoint_path, revision_key, costs[-1][0])
+        return len(costs)
+
+    def _report_progress(self, updated: int, total: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"Recomputed {updated}/{total} proposals ({self._rate(updated, elapsed):.0f} rows/s)")
+
+    @transaction.atomic
+    def _write_chunk(self, costs: List[Tuple[int, float]], tariff: Tariff, average_rate: float) -> None:
+        proposals = list(
+            ProposalUtility.objects.select_related('project').select_for_update()
+            .filter(id__in=[proposal_id for proposal_id, _ in costs])
+        )
+        # bulk_update skips the post_save signal, so move the analytics totals by hand
+        AnalyticsRepository.record(proposals, sign=-1)
+
+        cost_by_id = dict(costs)
+        for proposal in proposals:
+            proposal.first_year_cost = cost_by_id[proposal.id]
+            proposal.average_rate = average_rate
+            proposal.tariff = tariff
+        # Only the cost differs per row; bulk_update builds a CASE per row and field
+        ProposalUtility.objects.filter(id__in=cost_by_id).update(average_rate=average_rate, tariff=tariff)
+        ProposalUtility.objects.bulk_update(proposals, ['first_year_cost'])
+
+        AnalyticsRepository.record(proposals, sign=1)
+
+    def _revision_key(self, rate_info: Dict, tariff: Tariff, average_rate: float) -> str:
+        """
+        Hash of everything the written rows depend on. The tariff's content
+        hash only covers its label and rate structure, so a revision that
+        changes the schedule or fixed charge must not resume an old run.
+        """
+        grid_key = QuoteGrid.tariff_key(rate_info, repr(RateCalculator().load_curve))
+        return hashlib.sha256(repr((grid_key, tariff.pk, average_rate)).encode('utf-8')).hexdigest()
+
+    def _read_checkpoint(self, path: str, revision_key: str) -> int:
+        if not os.path.exists(path):
+            return 0
+        with open(path, encoding='utf-8') as source:
+            checkpoint = json.load(source)
+        if checkpoint.get('revision_key') != revision_key:
+            self.stderr.write("Checkpoint was written for a different revision, starting over")
+            return 0
+        return checkpoint['last_id']
+
+    def _write_checkpoint(self, path: str, revision_key: str, last_id: int) -> None:
+        # Write then rename so an interruption never leaves a truncated checkpoint
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as target:
+            json.dump({'revision_key': revision_key, 'last_id': last_id}, target)
+        os.replace(f"{path}.tmp", path)
+
+    def _rate(self, rows: int, elapsed: float) -> float:
+        return rows / elapsed if elapsed else 0.0
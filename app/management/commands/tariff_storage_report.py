@@ -0,0 +1,29 @@
+import json
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from app.models import ProposalUtility, Tariff
+
+
+class Command(BaseCommand):
+    help = "Report how much rate structure storage the shared tariff table saves"
+
+    def handle(self, *args, **options):
+        proposal_count = ProposalUtility.objects.exclude(tariff=None).count()
+        tariffs = Tariff.objects.annotate(proposal_count=Count('proposals'))
+
+        stored_bytes = 0
+        duplicated_bytes = 0
+        for tariff in tariffs.iterator(chunk_size=500):
+            size = len(json.dumps(tariff.structure, separators=(',', ':')))
+            stored_bytes += size
+            duplicated_bytes += size * tariff.proposal_count
+
+        saved = duplicated_bytes - stored_bytes
+        ratio = (saved / duplicated_bytes * 100) if duplicated_bytes else 0.0
+
+        self.stdout.write(f"Proposals referencing a tariff: {proposal_count}")
+        self.stdout.write(f"Distinct tariffs stored: {tariffs.count()}")
+        self.stdout.write(f"Rate structure bytes if copied per proposal: {duplicated_bytes}")
+        self.stdout.write(f"Rate structure bytes stored: {stored_bytes}")
+        self.stdout.write(self.style.SUCCESS(f"Storage reduction: {saved} bytes ({ratio:.1f}%)"))
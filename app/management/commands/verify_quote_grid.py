@@ -0,0 +1,45 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from app.benchmarks import FIXTURE_NAMES, load_fixture
+from app.services import QuoteGrid, RateCalculator, RateProcessor
+
+
+class Command(BaseCommand):
+    help = "Check precomputed quote grids against the live rate calculator"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fixture', action='append', choices=FIXTURE_NAMES,
+                            help="Recorded OpenEI response to verify (default: all)")
+        parser.add_argument('--file', help="Path to an OpenEI response saved as JSON")
+        parser.add_argument('--samples', type=int, default=200,
+                            help="Random off-grid inputs used to measure interpolation error")
+
+    def handle(self, *args, **options):
+        if options['file']:
+            with open(options['file'], encoding='utf-8') as source:
+                responses = {options['file']: json.load(source)}
+        else:
+            responses = {
+                name: json.loads(load_fixture(name))
+                for name in options['fixture'] or FIXTURE_NAMES
+            }
+
+        processor = RateProcessor()
+        calculator = RateCalculator()
+        failures = 0
+        for source, data in responses.items():
+            for rate_info in processor.process_rate_data(data):
+                grid = QuoteGrid.build(rate_info, calculator)
+                report = grid.verify(rate_info, calculator, samples=options['samples'])
+                failures += report['grid_mismatches'] > 0
+                self.stdout.write(
+                    f"{source}: {rate_info['name'][:50]:<50} "
+                    f"mismatches {report['grid_mismatches']}/{report['grid_points']}  "
+                    f"interpolation max {report['max_interpolation_error_pct']:.4f}% "
+                    f"mean {report['mean_interpolation_error_pct']:.4f}%"
+                )
+
+        if failures:
+            raise CommandError(f"{failures} tariff grid(s) disagree with the calculator")
+        self.stdout.write(self.style.SUCCESS("All grid points match the calculator"))
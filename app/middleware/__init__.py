@@ -0,0 +1,4 @@
+from .server_timing import ServerTimingMiddleware
+from .profiling import ProfilingMiddleware
+
+__all__ = ['ServerTimingMiddleware', 'ProfilingMiddleware']
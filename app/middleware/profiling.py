@@ -0,0 +1,134 @@
+import cProfile
+import json
+import logging
+import random
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode
+from django.conf import settings
+
+from ..profiling import ProfileStore, SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+MAX_BODY_BYTES = 4096
+# Field names containing any of these are redacted from stored bodies and query strings
+SENSITIVE_FIELDS = ('password', 'passwd', 'secret', 'token', 'api_key', 'apikey', 'authorization', 'csrf', 'session')
+REDACTED = '[redacted]'
+
+class ProfilingMiddleware:
+    """
+    Opt-in request profiler. A request is profiled with cProfile when a
+    staff user sends `X-Profile: 1` or it falls within PROFILER_SAMPLE_RATE.
+    With PROFILER_SLOW_THRESHOLD_MS set, every other request runs under the
+    sampling profiler and is kept only if it exceeds the threshold.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILER_SAMPLE_RATE', 0.0)
+        self.slow_threshold_ms = getattr(settings, 'PROFILER_SLOW_THRESHOLD_MS', None)
+        self.capture_bodies = getattr(settings, 'PROFILER_CAPTURE_BODIES', False)
+        self.store = ProfileStore(
+            settings.PROFILER_DIR,
+            getattr(settings, 'PROFILER_MAX_CAPTURES', 20)
+        )
+
+    def __call__(self, request):
+        if self._requested(request) or (self.sample_rate and random.random() < self.sample_rate):
+            return self._profile(request)
+        if self.slow_threshold_ms is not None:
+            return self._sample(request)
+        return self.get_response(request)
+
+    def _requested(self, request) -> bool:
+        if request.META.get(PROFILE_HEADER) != '1':
+            return False
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_staff)
+
+    def _profile(self, request):
+        request_info = self._request_info(request)
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active on this thread
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        capture_id = self._save('cprofile', duration_ms, request_info, profiler.dump_stats)
+        if capture_id:
+            response['X-Profile-Id'] = capture_id
+        return response
+
+    def _sample(self, request):
+        request_info = self._request_info(request)
+        sampler = SamplingProfiler(threading.get_ident())
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        if duration_ms >= self.slow_threshold_ms and sampler.samples:
+            capture_id = self._save('sampling', duration_ms, request_info, sampler.write_collapsed)
+            if capture_id:
+                response['X-Profile-Id'] = capture_id
+        return response
+
+    def _save(self, kind, duration_ms, request_info, write):
+        try:
+            return self.store.save(kind, duration_ms, request_info, write)
+        except OSError as e:
+            logger.error(f"Error saving profile capture: {str(e)}")
+            return None
+
+    def _request_info(self, request) -> dict:
+        query = [
+            (key, REDACTED if self._is_sensitive(key) else value)
+            for key, value in parse_qsl(request.META.get('QUERY_STRING', ''), keep_blank_values=True)
+        ]
+        return {
+            'method': request.method,
+            'path': request.path,
+            'query': urlencode(query),
+            'body': self._body(request) if self.capture_bodies else '',
+        }
+
+    def _body(self, request) -> str:
+        """
+        Redacted JSON body of an API request, empty for anything else so
+        form posts such as the admin login never reach the disk
+        """
+        if not request.path.startswith('/api/') or request.content_type != 'application/json':
+            return ''
+        # Read the body before the view so DRF can still parse it afterwards
+        try:
+            data = json.loads(request.body)
+        except Exception:
+            return ''
+        return json.dumps(self._redact(data))[:MAX_BODY_BYTES]
+
+    def _redact(self, value):
+        if isinstance(value, dict):
+            return {
+                key: REDACTED if self._is_sensitive(key) else self._redact(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._redact(item) for item in value]
+        return value
+
+    @staticmethod
+    def _is_sensitive(key) -> bool:
+        key = str(key).lower()
+        return any(field in key for field in SENSITIVE_FIELDS)
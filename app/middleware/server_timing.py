@@ -0,0 +1,42 @@
+import time
+from collections import OrderedDict
+
+from ..metrics import finish_request_timings, registry, start_request_timings
+
+request_duration = registry.histogram(
+    'solarate_http_request_duration_seconds',
+    'Total time spent handling HTTP requests'
+)
+
+class ServerTimingMiddleware:
+    """
+    Collects the spans recorded while handling a request and reports them
+    in a Server-Timing header alongside the total request time
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_request_timings()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            timings = finish_request_timings(token)
+        total = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match else 'unmatched'
+        request_duration.observe(total, route=route, method=request.method)
+
+        # Stages that ran more than once in a request are summed
+        durations = OrderedDict()
+        for stage, elapsed in timings:
+            durations[stage] = durations.get(stage, 0.0) + elapsed
+        durations['total'] = total
+
+        response['Server-Timing'] = ', '.join(
+            f"{stage};dur={elapsed * 1000:.2f}" for stage, elapsed in durations.items()
+        )
+        return response
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+from app.hashing import content_hash
+
+
+def deduplicate_pricing_matrix(apps, schema_editor):
+    """Move each distinct pricing_matrix into a single shared Tariff row"""
+    Tariff = apps.get_model('app', 'Tariff')
+    ProposalUtility = apps.get_model('app', 'ProposalUtility')
+
+    tariff_ids = {}
+    proposals = ProposalUtility.objects.only('id', 'openei_id', 'pricing_matrix').iterator(chunk_size=2000)
+    for proposal in proposals:
+        structure = proposal.pricing_matrix or []
+        digest = content_hash({'label': proposal.openei_id, 'structure': structure})
+        if digest not in tariff_ids:
+            tariff, _ = Tariff.objects.get_or_create(
+                content_hash=digest,
+                defaults={'label': proposal.openei_id, 'structure': structure}
+            )
+            tariff_ids[digest] = tariff.id
+        ProposalUtility.objects.filter(id=proposal.id).update(tariff_id=tariff_ids[digest])
+
+
+def restore_pricing_matrix(apps, schema_editor):
+    """Copy shared structures back onto each proposal"""
+    ProposalUtility = apps.get_model('app', 'ProposalUtility')
+
+    proposals = ProposalUtility.objects.select_related('tariff').exclude(tariff=None)
+    for proposal in proposals.iterator(chunk_size=2000):
+        ProposalUtility.objects.filter(id=proposal.id).update(
+            pricing_matrix=proposal.tariff.structure
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_tariff'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_pricing_matrix, restore_pricing_matrix),
+    ]
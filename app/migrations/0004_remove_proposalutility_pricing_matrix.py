@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_deduplicate_pricing_matrix'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='proposalutility',
+            name='pricing_matrix',
+        ),
+    ]
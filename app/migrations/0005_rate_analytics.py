@@ -0,0 +1,36 @@
+# Generated by Django 5.1.2 on 2026-10-19 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_remove_proposalutility_pricing_matrix'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposalutility',
+            name='utility',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.CreateModel(
+            name='RateAnalytics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('utility', 'Utility'), ('plan', 'Rate plan')], max_length=20)),
+                ('key', models.CharField(max_length=255)),
+                ('name', models.CharField(blank=True, default='', max_length=255)),
+                ('quote_count', models.IntegerField(default=0)),
+                ('first_year_cost_sum', models.FloatField(default=0.0)),
+                ('average_rate_sum', models.FloatField(default=0.0)),
+                ('consumption_sum', models.FloatField(default=0.0)),
+                ('consumption_histogram', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'key'), name='unique_rate_analytics_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-19 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_rate_analytics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UtilityCell',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cell', models.CharField(max_length=64, unique=True)),
+                ('utility_ids', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-19 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_utility_cell'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TariffVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=100)),
+                ('eiaid', models.IntegerField(null=True)),
+                ('utility', models.CharField(blank=True, max_length=255)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('is_default', models.BooleanField(default=False)),
+                ('startdate', models.DateTimeField()),
+                ('enddate', models.DateTimeField(blank=True, null=True)),
+                ('item', models.JSONField(help_text='Raw OpenEI item for this revision')),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['label', 'startdate', 'enddate'], name='tariff_version_label_idx'), models.Index(fields=['eiaid', 'startdate', 'enddate'], name='tariff_version_eiaid_idx')],
+                'constraints': [models.UniqueConstraint(fields=('label', 'startdate'), name='unique_tariff_version')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-19 14:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_tariff_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuotaBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('tokens', models.FloatField()),
+                ('refilled_at', models.DateTimeField()),
+                ('revision', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_quota_bucket'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quotabucket',
+            name='blocked_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .hashing import content_hash
 
 class Project(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -26,6 +27,38 @@ class Project(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Project - {self.address}"
 
+class TariffManager(models.Manager):
+    def get_or_create_for(self, label: str, structure) -> 'Tariff':
+        """Return the stored tariff for this content, creating it once"""
+        structure = structure or []
+        tariff, _ = self.get_or_create(
+            content_hash=Tariff.compute_hash(label, structure),
+            defaults={'label': label, 'structure': structure}
+        )
+        return tariff
+
+class Tariff(models.Model):
+    """
+    Rate structure stored once and shared by every proposal quoting it,
+    addressed by a hash of its label and structure
+    """
+    content_hash = models.CharField(max_length=64, unique=True)
+    label = models.CharField(max_length=100, db_index=True)
+    structure = models.JSONField(
+        default=list,
+        help_text="Stores the complete rate structure including time periods and tiers"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TariffManager()
+
+    @staticmethod
+    def compute_hash(label: str, structure) -> str:
+        return content_hash({'label': label, 'structure': structure})
+
+    def __str__(self):
+        return f"Tariff {self.label} ({self.content_hash[:12]})"
+
 class ProposalUtility(models.Model):
     project = models.OneToOneField(
         Project,
@@ -34,13 +67,113 @@ class ProposalUtility(models.Model):
     )
     openei_id = models.CharField(max_length=100)
     rate_name = models.CharField(max_length=255)
+    utility = models.CharField(max_length=255, blank=True, default='')
     average_rate = models.FloatField()  # cents/kWh
     first_year_cost = models.FloatField()  # $
-    pricing_matrix = models.JSONField(
+    tariff = models.ForeignKey(
+        Tariff,
+        on_delete=models.PROTECT,
+        related_name='proposals',
         null=True,
-        blank=True,
-        help_text="Stores the complete rate structure including time periods and tiers"
+        blank=True
     )
 
+    @property
+    def pricing_matrix(self):
+        """Rate structure of the referenced tariff"""
+        return self.tariff.structure if self.tariff_id else None
+
     def __str__(self):
         return f"Utility Proposal for {self.project.address}"
+
+class RateAnalytics(models.Model):
+    """
+    Running totals of saved proposals per utility or per rate plan,
+    maintained incrementally so dashboards never scan the proposal table
+    """
+    DIMENSION_UTILITY = 'utility'
+    DIMENSION_PLAN = 'plan'
+    DIMENSION_CHOICES = [
+        (DIMENSION_UTILITY, 'Utility'),
+        (DIMENSION_PLAN, 'Rate plan'),
+    ]
+
+    # Consumption histogram buckets in kWh, matching InputValidator limits
+    CONSUMPTION_BUCKET_MIN = 1000
+    CONSUMPTION_BUCKET_WIDTH = 1000
+    CONSUMPTION_BUCKET_COUNT = 9
+
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    key = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, blank=True, default='')
+    quote_count = models.IntegerField(default=0)
+    first_year_cost_sum = models.FloatField(default=0.0)  # $
+    average_rate_sum = models.FloatField(default=0.0)  # cents/kWh
+    consumption_sum = models.FloatField(default=0.0)  # kWh
+    consumption_histogram = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'key'], name='unique_rate_analytics_key')
+        ]
+
+    @classmethod
+    def consumption_bucket(cls, consumption: float) -> int:
+        index = int((consumption - cls.CONSUMPTION_BUCKET_MIN) // cls.CONSUMPTION_BUCKET_WIDTH)
+        return min(max(index, 0), cls.CONSUMPTION_BUCKET_COUNT - 1)
+
+    def __str__(self):
+        return f"{self.get_dimension_display()} analytics for {self.key}"
+
+class UtilityCell(models.Model):
+    """Utility IDs (EIA) known to serve a geocell or ZIP code"""
+    cell = models.CharField(max_length=64, unique=True)
+    utility_ids = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.cell}: {', '.join(str(utility_id) for utility_id in self.utility_ids)}"
+
+class TariffVersion(models.Model):
+    """
+    One revision of an OpenEI tariff and the interval it is effective for,
+    kept so quotes can be priced as of any date without refetching
+    """
+    label = models.CharField(max_length=100)
+    eiaid = models.IntegerField(null=True)
+    utility = models.CharField(max_length=255, blank=True)
+    name = models.CharField(max_length=255, blank=True)
+    is_default = models.BooleanField(default=False)
+    startdate = models.DateTimeField()
+    enddate = models.DateTimeField(null=True, blank=True)  # Open-ended when null
+    item = models.JSONField(help_text="Raw OpenEI item for this revision")
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['label', 'startdate'], name='unique_tariff_version'),
+        ]
+        indexes = [
+            models.Index(fields=['label', 'startdate', 'enddate'], name='tariff_version_label_idx'),
+            models.Index(fields=['eiaid', 'startdate', 'enddate'], name='tariff_version_eiaid_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.label}) from {self.startdate:%Y-%m-%d}"
+
+class QuotaBucket(models.Model):
+    """
+    Token bucket shared by every worker calling a rate-limited upstream API.
+    revision increments on each write so concurrent takers never overwrite
+    each other's update. blocked_until holds off every taker after the
+    upstream itself rejected a call.
+    """
+    name = models.CharField(max_length=64, unique=True)
+    tokens = models.FloatField()
+    refilled_at = models.DateTimeField()
+    revision = models.PositiveBigIntegerField(default=0)
+    blocked_until = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.tokens:.1f} tokens"
@@ -0,0 +1,121 @@
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class SamplingProfiler:
+    """
+    Samples one thread's call stack on a background thread at a fixed
+    interval. Much cheaper than cProfile, so it can watch every request
+    and only the slow ones need to be kept.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path):
+        """Write stacks in the collapsed format read by flame graph tools"""
+        with open(path, 'w', encoding='utf-8') as output:
+            for stack, count in self.samples.most_common():
+                output.write(f"{stack} {count}\n")
+
+class ProfileStore:
+    """
+    Keeps the N slowest profile captures on disk. Each capture is a profile
+    file plus a JSON sidecar with the request details.
+    """
+
+    EXTENSIONS = {'cprofile': '.prof', 'sampling': '.txt'}
+
+    def __init__(self, directory: Path, max_captures: int = 20):
+        self.directory = Path(directory)
+        self.max_captures = max_captures
+        self._lock = threading.Lock()
+
+    def save(self, kind: str, duration_ms: float, request_info: Dict,
+             write: Callable[[Path], None]) -> Optional[str]:
+        """
+        Store a capture unless the ring is full of slower ones,
+        returns the capture id or None when it was discarded
+        """
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            captures = self.list()
+            if len(captures) >= self.max_captures:
+                fastest = captures[-1]
+                if duration_ms <= fastest['duration_ms']:
+                    return None
+                self._delete(fastest)
+
+            capture_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+            filename = capture_id + self.EXTENSIONS[kind]
+            write(self.directory / filename)
+            meta = {
+                'id': capture_id,
+                'kind': kind,
+                'filename': filename,
+                'duration_ms': round(duration_ms, 2),
+                'captured_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'request': request_info,
+            }
+            (self.directory / f"{capture_id}.json").write_text(json.dumps(meta))
+            return capture_id
+
+    def list(self) -> List[Dict]:
+        """Captures ordered from slowest to fastest"""
+        captures = []
+        for meta_path in self.directory.glob('*.json'):
+            try:
+                captures.append(json.loads(meta_path.read_text()))
+            except (OSError, ValueError):
+                logger.warning(f"Skipping unreadable profile metadata {meta_path.name}")
+        return sorted(captures, key=lambda meta: meta['duration_ms'], reverse=True)
+
+    def get(self, capture_id: str) -> Optional[Dict]:
+        # Ids are generated here, anything else could escape the directory
+        if not all(char.isalnum() or char == '-' for char in capture_id):
+            return None
+        meta_path = self.directory / f"{capture_id}.json"
+        if not meta_path.exists():
+            return None
+        return json.loads(meta_path.read_text())
+
+    def path_for(self, meta: Dict) -> Path:
+        return self.directory / meta['filename']
+
+    def _delete(self, meta: Dict):
+        for path in (self.path_for(meta), self.directory / f"{meta['id']}.json"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
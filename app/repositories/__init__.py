@@ -1,3 +1,6 @@
-from .project_repository import ProjectRepository
-
-__all__ = ['ProjectRepository']
\ No newline at end of file
+from .project_repository import ProjectRepository
+from .analytics_repository import AnalyticsRepository
+from .location_repository import LocationRepository
+from .tariff_version_repository import TariffVersionRepository
+
+__all__ = ['ProjectRepository', 'AnalyticsRepository', 'LocationRepository', 'TariffVersionRepository']
\ No newline at end of file
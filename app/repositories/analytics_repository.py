@@ -0,0 +1,121 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from django.db import transaction
+from ..models import Project, ProposalUtility, RateAnalytics
+
+logger = logging.getLogger(__name__)
+
+class AnalyticsRepository:
+    """Maintains and reads the per-utility and per-plan running totals"""
+
+    @staticmethod
+    def record(proposals: Iterable[ProposalUtility], sign: int = 1) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) proposals from the running totals
+        Deltas are folded per key first so a batch costs one write per key
+        """
+        deltas = AnalyticsRepository._collect(proposals, sign)
+        if deltas:
+            AnalyticsRepository._apply(deltas)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild() -> int:
+        """Recompute every total from the proposal table, returns rows written"""
+        proposals = ProposalUtility.objects.select_related('project').iterator(chunk_size=2000)
+        deltas = AnalyticsRepository._collect(proposals, 1)
+
+        RateAnalytics.objects.all().delete()
+        RateAnalytics.objects.bulk_create(
+            [
+                RateAnalytics(dimension=dimension, key=key, **values)
+                for (dimension, key), values in deltas.items()
+            ],
+            batch_size=500
+        )
+        return len(deltas)
+
+    @staticmethod
+    def get_summary(dimension: str, key: str) -> Optional[Dict]:
+        row = RateAnalytics.objects.filter(dimension=dimension, key=key).first()
+        return AnalyticsRepository.summarize(row) if row else None
+
+    @staticmethod
+    def list_summaries(dimension: str) -> List[Dict]:
+        rows = RateAnalytics.objects.filter(dimension=dimension, quote_count__gt=0).order_by('-quote_count')
+        return [AnalyticsRepository.summarize(row) for row in rows]
+
+    @staticmethod
+    def summarize(row: RateAnalytics) -> Dict:
+        count = row.quote_count
+        return {
+            'dimension': row.dimension,
+            'key': row.key,
+            'name': row.name,
+            'quote_count': count,
+            'average_first_year_cost': round(row.first_year_cost_sum / count, 2) if count else 0.0,
+            'average_rate': round(row.average_rate_sum / count, 4) if count else 0.0,
+            'average_consumption': round(row.consumption_sum / count, 2) if count else 0.0,
+            'consumption_histogram': [
+                {
+                    'min': RateAnalytics.CONSUMPTION_BUCKET_MIN + i * RateAnalytics.CONSUMPTION_BUCKET_WIDTH,
+                    'max': RateAnalytics.CONSUMPTION_BUCKET_MIN + (i + 1) * RateAnalytics.CONSUMPTION_BUCKET_WIDTH,
+                    'count': bucket_count
+                }
+                for i, bucket_count in enumerate(row.consumption_histogram)
+            ]
+        }
+
+    @staticmethod
+    def _collect(proposals: Iterable[ProposalUtility], sign: int) -> Dict:
+        deltas = defaultdict(lambda: {
+            'name': '',
+            'quote_count': 0,
+            'first_year_cost_sum': 0.0,
+            'average_rate_sum': 0.0,
+            'consumption_sum': 0.0,
+            'consumption_histogram': [0] * RateAnalytics.CONSUMPTION_BUCKET_COUNT,
+        })
+
+        for proposal in proposals:
+            try:
+                consumption = proposal.project.consumption
+            except Project.DoesNotExist:
+                consumption = None
+
+            keys = [(RateAnalytics.DIMENSION_PLAN, proposal.openei_id, proposal.rate_name)]
+            if proposal.utility:
+                keys.append((RateAnalytics.DIMENSION_UTILITY, proposal.utility, proposal.utility))
+
+            for dimension, key, name in keys:
+                delta = deltas[(dimension, key)]
+                delta['name'] = name
+                delta['quote_count'] += sign
+                delta['first_year_cost_sum'] += sign * float(proposal.first_year_cost)
+                delta['average_rate_sum'] += sign * float(proposal.average_rate)
+                if consumption is not None:
+                    delta['consumption_sum'] += sign * consumption
+                    delta['consumption_histogram'][RateAnalytics.consumption_bucket(consumption)] += sign
+
+        return deltas
+
+    @staticmethod
+    @transaction.atomic
+    def _apply(deltas: Dict) -> None:
+        for (dimension, key), delta in deltas.items():
+            row, _ = RateAnalytics.objects.select_for_update().get_or_create(
+                dimension=dimension,
+                key=key,
+                defaults={'consumption_histogram': [0] * RateAnalytics.CONSUMPTION_BUCKET_COUNT}
+            )
+            row.name = delta['name'] or row.name
+            row.quote_count += delta['quote_count']
+            row.first_year_cost_sum += delta['first_year_cost_sum']
+            row.average_rate_sum += delta['average_rate_sum']
+            row.consumption_sum += delta['consumption_sum']
+            row.consumption_histogram = [
+                current + change
+                for current, change in zip(row.consumption_histogram, delta['consumption_histogram'])
+            ]
+            row.save()
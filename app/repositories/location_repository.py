@@ -0,0 +1,25 @@
+import logging
+from typing import Iterable, List
+from ..models import UtilityCell
+
+logger = logging.getLogger(__name__)
+
+class LocationRepository:
+    """Remembers which utilities serve each geocell"""
+
+    @staticmethod
+    def get_utility_ids(cell: str) -> List[int]:
+        row = UtilityCell.objects.filter(cell=cell).only('utility_ids').first()
+        return row.utility_ids if row else []
+
+    @staticmethod
+    def remember_utility_ids(cell: str, utility_ids: Iterable[int]) -> None:
+        """Merge newly seen utility IDs into the cell"""
+        try:
+            row, _ = UtilityCell.objects.get_or_create(cell=cell)
+            merged = sorted(set(row.utility_ids) | set(utility_ids))
+            if merged != row.utility_ids:
+                row.utility_ids = merged
+                row.save(update_fields=['utility_ids', 'updated_at'])
+        except Exception as e:
+            logger.error(f"Error saving utilities for {cell}: {str(e)}")
@@ -2,7 +2,7 @@ from decimal import Decimal
 import logging
 from typing import Dict, Optional
 from django.db import transaction
-from ..models import Project, ProposalUtility
+from ..models import Project, ProposalUtility, Tariff
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,19 @@ class ProjectRepository:
                 selected_rate=rate_info['name']
             )
 
+            tariff = Tariff.objects.get_or_create_for(
+                rate_info['label'],
+                rate_info.get('energyratestructure', [])
+            )
+
             ProposalUtility.objects.create(
                 project=project,
                 openei_id=rate_info['label'],
                 rate_name=rate_info['name'],
+                utility=rate_info.get('utility', ''),
                 average_rate=Decimal(str(rate_info['avg_rate'])),  # Convert to Decimal
                 first_year_cost=Decimal(str(first_year_cost)),
-                pricing_matrix=rate_info.get('energyratestructure', []),
+                tariff=tariff,
             )
 
             return project
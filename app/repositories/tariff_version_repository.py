@@ -0,0 +1,73 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from django.db.models import Q
+from ..models import TariffVersion
+
+logger = logging.getLogger(__name__)
+
+class TariffVersionRepository:
+    """Stores tariff revisions and finds the one effective on a date"""
+
+    @staticmethod
+    def index(items: Iterable[Dict]) -> int:
+        """Upsert fetched OpenEI items as versions, returns how many were written"""
+        versions = [
+            TariffVersion(
+                label=item['label'],
+                eiaid=item.get('eiaid'),
+                utility=item.get('utility', ''),
+                name=item.get('name', ''),
+                is_default=bool(item.get('is_default', False)),
+                startdate=TariffVersionRepository._to_datetime(item.get('startdate') or 0),
+                enddate=TariffVersionRepository._to_datetime(item['enddate']) if item.get('enddate') else None,
+                item=item,
+            )
+            for item in items if item.get('label')
+        ]
+        try:
+            TariffVersion.objects.bulk_create(
+                versions,
+                update_conflicts=True,
+                unique_fields=['label', 'startdate'],
+                update_fields=['eiaid', 'utility', 'name', 'is_default', 'enddate', 'item', 'fetched_at'],
+            )
+        except Exception as e:
+            logger.error(f"Error indexing tariff versions: {str(e)}")
+            return 0
+        return len(versions)
+
+    @staticmethod
+    def effective_items(eiaids: Iterable[int], as_of: datetime) -> List[Dict]:
+        """Raw items of every utility's tariffs in effect on as_of, defaults first"""
+        versions = TariffVersion.objects.filter(
+            TariffVersionRepository._effective_on(as_of),
+            eiaid__in=list(eiaids),
+        ).order_by('-is_default', 'startdate')
+        return [version.item for version in versions]
+
+    @staticmethod
+    def as_of(api_data: Dict, as_of: datetime) -> Dict:
+        """
+        Swap a response's current tariffs for the revisions its utilities
+        had in effect on as_of
+        """
+        eiaids = {item['eiaid'] for item in api_data.get('items', []) if item.get('eiaid')}
+        return {'items': TariffVersionRepository.effective_items(eiaids, as_of)}
+
+    @staticmethod
+    def version_of(label: str, as_of: datetime) -> Optional[Dict]:
+        """Raw item of the revision of label in effect on as_of"""
+        version = TariffVersion.objects.filter(
+            TariffVersionRepository._effective_on(as_of),
+            label=label,
+        ).order_by('-startdate').only('item').first()
+        return version.item if version else None
+
+    @staticmethod
+    def _effective_on(as_of: datetime) -> Q:
+        return Q(startdate__lte=as_of) & (Q(enddate__isnull=True) | Q(enddate__gt=as_of))
+
+    @staticmethod
+    def _to_datetime(timestamp: int) -> datetime:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
@@ -2,11 +2,26 @@ from .rate_provider import RateDataProvider, OpenEIRateProvider
 from .rate_processor import RateProcessor
 from .rate_calculator import RateCalculator
 from .input_validator import InputValidator
+from .location_resolver import LocationResolver, GeocodingBackend, NominatimGeocodingBackend, OfflineGeocodingBackend
+from .resolving_rate_provider import ResolvingRateProvider
+from .quote_grid import QuoteGrid, QuoteGridStore
+from .plan_recommender import PlanRecommender
+from .openei_quota import OpenEIQuota, QuotaExceeded
 
 __all__ = [
     'RateDataProvider',
     'OpenEIRateProvider',
     'RateProcessor',
     'RateCalculator',
-    'InputValidator'
+    'InputValidator',
+    'LocationResolver',
+    'GeocodingBackend',
+    'NominatimGeocodingBackend',
+    'OfflineGeocodingBackend',
+    'ResolvingRateProvider',
+    'QuoteGrid',
+    'QuoteGridStore',
+    'PlanRecommender',
+    'OpenEIQuota',
+    'QuotaExceeded'
 ]
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Dict, Optional
 
 class InputValidator:
@@ -11,3 +12,17 @@ class InputValidator:
         if not 4 <= escalator <= 10:
             return {'error': 'Escalator must be between 4% and 10%'}
         return None
+
+    @staticmethod
+    def validate_as_of(as_of: Optional[str]) -> Optional[Dict]:
+        if as_of and InputValidator.parse_as_of(as_of) is None:
+            return {'error': 'as_of must be a date in YYYY-MM-DD format'}
+        return None
+
+    @staticmethod
+    def parse_as_of(as_of: Optional[str]) -> Optional[datetime]:
+        """Start of the given day in UTC, or None when missing or malformed"""
+        try:
+            return datetime.strptime(as_of, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,163 @@
+import csv
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import usaddress
+from django.conf import settings
+from django.core.cache import cache
+from ..hashing import content_hash
+
+logger = logging.getLogger(__name__)
+
+# USPS standard abbreviations for the most common street suffixes
+STREET_SUFFIXES = {
+    'ALLEY': 'ALY', 'AVENUE': 'AVE', 'AV': 'AVE', 'BOULEVARD': 'BLVD', 'CIRCLE': 'CIR',
+    'COURT': 'CT', 'DRIVE': 'DR', 'EXPRESSWAY': 'EXPY', 'FREEWAY': 'FWY', 'HIGHWAY': 'HWY',
+    'LANE': 'LN', 'PARKWAY': 'PKWY', 'PLACE': 'PL', 'PLAZA': 'PLZ', 'ROAD': 'RD',
+    'SQUARE': 'SQ', 'STREET': 'ST', 'STR': 'ST', 'TERRACE': 'TER', 'TRAIL': 'TRL', 'WAY': 'WAY',
+}
+DIRECTIONALS = {
+    'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W',
+    'NORTHEAST': 'NE', 'NORTHWEST': 'NW', 'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW',
+}
+# Unit details never change which utility serves an address
+IGNORED_LABELS = {'OccupancyType', 'OccupancyIdentifier', 'SubaddressType', 'SubaddressIdentifier', 'Recipient'}
+ZIP_PATTERN = re.compile(r'\b(\d{5})(?:-\d{4})?\b')
+
+@dataclass(frozen=True)
+class Location:
+    """Canonical form of an address and the coarse areas it falls in"""
+    canonical: str
+    zip_code: Optional[str] = None
+    cell: Optional[str] = None
+
+class AddressCanonicalizer:
+    """Normalizes free-form US addresses so equivalent spellings compare equal"""
+
+    def canonicalize(self, address: str) -> Tuple[str, Optional[str]]:
+        """Returns the canonical address string and its 5-digit ZIP code"""
+        try:
+            tagged, _ = usaddress.tag(address)
+        except usaddress.RepeatedLabelError:
+            return self._fallback(address)
+
+        parts = []
+        zip_code = None
+        for label, value in tagged.items():
+            if label in IGNORED_LABELS:
+                continue
+            value = self._clean(value)
+            if label == 'ZipCode':
+                match = ZIP_PATTERN.search(value)
+                zip_code = match.group(1) if match else None
+                value = zip_code or value
+            elif label in ('StreetNamePostType', 'StreetNamePreType'):
+                value = STREET_SUFFIXES.get(value, value)
+            elif label in ('StreetNamePreDirectional', 'StreetNamePostDirectional'):
+                value = DIRECTIONALS.get(value, value)
+            if value:
+                parts.append(value)
+
+        return ' '.join(parts), zip_code
+
+    def _fallback(self, address: str) -> Tuple[str, Optional[str]]:
+        match = ZIP_PATTERN.search(address)
+        return self._clean(address), match.group(1) if match else None
+
+    @staticmethod
+    def _clean(value: str) -> str:
+        return ' '.join(re.sub(r'[^\w\s-]', ' ', value).upper().split())
+
+class GeocodingBackend(ABC):
+    """Abstract interface for turning a canonical address into coordinates"""
+    @abstractmethod
+    def geocode(self, canonical: str, zip_code: Optional[str]) -> Optional[Tuple[float, float]]:
+        pass
+
+class NominatimGeocodingBackend(GeocodingBackend):
+    """Geocodes through OpenStreetMap Nominatim via geopy"""
+
+    def __init__(self, user_agent: str = 'solarate', timeout: float = 5):
+        from geopy.geocoders import Nominatim
+        self.geocoder = Nominatim(user_agent=user_agent, timeout=timeout)
+
+    def geocode(self, canonical: str, zip_code: Optional[str]) -> Optional[Tuple[float, float]]:
+        try:
+            result = self.geocoder.geocode(canonical, country_codes='us')
+            return (result.latitude, result.longitude) if result else None
+        except Exception as e:
+            logger.warning(f"Geocoding failed for {canonical}: {str(e)}")
+            return None
+
+class OfflineGeocodingBackend(GeocodingBackend):
+    """
+    Offline stand-in that places an address at its ZIP code centroid,
+    read from a CSV with zip, latitude and longitude columns
+    """
+
+    def __init__(self, centroids_path: Optional[str] = None):
+        self.centroids: Dict[str, Tuple[float, float]] = {}
+        if centroids_path:
+            with open(centroids_path, newline='', encoding='utf-8') as source:
+                for row in csv.DictReader(source):
+                    self.centroids[row['zip'].zfill(5)] = (float(row['latitude']), float(row['longitude']))
+
+    def geocode(self, canonical: str, zip_code: Optional[str]) -> Optional[Tuple[float, float]]:
+        return self.centroids.get(zip_code) if zip_code else None
+
+class LocationResolver:
+    """
+    Maps addresses to a canonical form, a ZIP code and a coarse geocell.
+    Results are cached because geocoding is slow and rate limited.
+    """
+    CACHE_PREFIX = 'location:'
+    CACHE_TTL = 60 * 60 * 24 * 30
+
+    def __init__(self, backend: GeocodingBackend, precision: int = 1):
+        self.canonicalizer = AddressCanonicalizer()
+        self.backend = backend
+        self.precision = precision
+
+    @classmethod
+    def from_settings(cls) -> 'LocationResolver':
+        if settings.GEOCODING_BACKEND == 'nominatim':
+            backend = NominatimGeocodingBackend(settings.GEOCODING_USER_AGENT)
+        else:
+            backend = OfflineGeocodingBackend(settings.ZIP_CENTROIDS_PATH)
+        return cls(backend, settings.GEOCELL_PRECISION)
+
+    def resolve(self, address: str) -> Location:
+        canonical, zip_code = self.canonicalizer.canonicalize(address)
+        cache_key = self.CACHE_PREFIX + content_hash(canonical)
+        location = cache.get(cache_key)
+        if location is None:
+            location = Location(canonical, zip_code, self._cell(canonical, zip_code))
+            cache.set(cache_key, location, self.CACHE_TTL)
+        return location
+
+    def _cell(self, canonical: str, zip_code: Optional[str]) -> Optional[str]:
+        """Rounded coordinates when geocoding succeeds, otherwise the ZIP code"""
+        coordinates = self.backend.geocode(canonical, zip_code)
+        if coordinates:
+            latitude, longitude = coordinates
+            return f"geo:{latitude:.{self.precision}f},{longitude:.{self.precision}f}"
+        if zip_code:
+            return f"zip:{zip_code}"
+        return None
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+def get_location_resolver() -> LocationResolver:
+    """
+    Process-wide resolver configured from settings, so the centroid file is
+    read and the geocoder built once rather than for every view instance
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = LocationResolver.from_settings()
+        return _resolver
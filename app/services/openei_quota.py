@@ -0,0 +1,146 @@
+import logging
+import time
+from datetime import timedelta
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+import requests
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+from ..metrics import registry
+from ..models import QuotaBucket
+
+logger = logging.getLogger(__name__)
+
+quota_requests = registry.counter(
+    'solarate_openei_quota_total',
+    'OpenEI quota token requests by priority and outcome'
+)
+quota_tokens = registry.gauge(
+    'solarate_openei_quota_tokens',
+    'OpenEI calls left in the shared hourly quota, as last seen by this process'
+)
+quota_utilization = registry.gauge(
+    'solarate_openei_quota_utilization',
+    'Fraction of the shared hourly OpenEI quota in use, as last seen by this process'
+)
+
+INTERACTIVE = 'interactive'
+REFRESH = 'refresh'
+BULK = 'bulk'
+
+_priority: ContextVar[str] = ContextVar('openei_priority', default=INTERACTIVE)
+
+@contextmanager
+def quota_priority(priority: str):
+    """Charge OpenEI calls made inside the block to a priority class"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+class QuotaExceeded(requests.RequestException):
+    """The shared OpenEI quota has no token for this priority class"""
+    def __init__(self, retry_after: float):
+        super().__init__(f"OpenEI quota exhausted, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class OpenEIQuota:
+    """
+    Hourly OpenEI quota shared across workers through a database token bucket.
+    Lower priority classes may only take a token while the bucket holds
+    more than their reserve, so background work leaves headroom for users.
+    Interactive callers fail fast with QuotaExceeded; refresh and bulk
+    callers wait for the bucket to refill.
+    """
+    BUCKET_NAME = 'openei'
+    # Fraction of the quota each class must leave untouched
+    RESERVES = {INTERACTIVE: 0.0, REFRESH: 0.1, BULK: 0.3}
+    MAX_WAIT_STEP = 5.0
+    MAX_CONFLICTS = 10
+
+    def __init__(self, hourly_quota: float):
+        self.capacity = hourly_quota
+        self.rate = hourly_quota / 3600
+
+    @classmethod
+    def from_settings(cls) -> Optional['OpenEIQuota']:
+        """Configured quota, or None when OPENEI_HOURLY_QUOTA is 0"""
+        from django.conf import settings
+        return cls(settings.OPENEI_HOURLY_QUOTA) if settings.OPENEI_HOURLY_QUOTA > 0 else None
+
+    def acquire(self, priority: Optional[str] = None):
+        """Take one token for priority (the calling context's class by default)"""
+        priority = priority or _priority.get()
+        waited = False
+        while True:
+            retry_after = self._try_take(priority)
+            if retry_after is None:
+                quota_requests.inc(priority=priority, outcome='waited' if waited else 'granted')
+                return
+            if priority == INTERACTIVE:
+                quota_requests.inc(priority=priority, outcome='rejected')
+                raise QuotaExceeded(retry_after)
+            waited = True
+            time.sleep(min(retry_after, self.MAX_WAIT_STEP))
+
+    def drain(self, retry_after: float):
+        """
+        Empty the bucket after upstream reports the quota is spent, and block
+        every class for retry_after seconds before it starts refilling
+        """
+        self._bucket()
+        blocked_until = timezone.now() + timedelta(seconds=retry_after)
+        QuotaBucket.objects.filter(name=self.BUCKET_NAME).update(
+            tokens=0.0, refilled_at=blocked_until, blocked_until=blocked_until, revision=F('revision') + 1
+        )
+        self._publish(0.0)
+        logger.warning(f"OpenEI rate limited us, blocking the shared quota for {retry_after:.0f}s")
+
+    def _try_take(self, priority: str) -> Optional[float]:
+        """
+        Take a token with a compare-and-swap on revision, returns None on
+        success or the seconds to wait before this class can try again
+        """
+        floor = self.RESERVES[priority] * self.capacity + 1
+        for _ in range(self.MAX_CONFLICTS):
+            bucket = self._bucket()
+            now = timezone.now()
+            if bucket.blocked_until and now < bucket.blocked_until:
+                self._publish(0.0)
+                return (bucket.blocked_until - now).total_seconds()
+            tokens = self._refilled(bucket, now)
+            if tokens < floor:
+                self._publish(tokens)
+                return (floor - tokens) / self.rate
+
+            updated = QuotaBucket.objects.filter(
+                name=self.BUCKET_NAME, revision=bucket.revision
+            ).update(tokens=tokens - 1, refilled_at=now, revision=bucket.revision + 1)
+            if updated:
+                self._publish(tokens - 1)
+                return None
+        # Heavy contention, back off briefly rather than spin
+        return 0.05
+
+    def _refilled(self, bucket: QuotaBucket, now) -> float:
+        elapsed = max((now - bucket.refilled_at).total_seconds(), 0.0)
+        return min(self.capacity, bucket.tokens + elapsed * self.rate)
+
+    def _bucket(self) -> QuotaBucket:
+        bucket = QuotaBucket.objects.filter(name=self.BUCKET_NAME).first()
+        if bucket is None:
+            try:
+                bucket = QuotaBucket.objects.create(
+                    name=self.BUCKET_NAME, tokens=self.capacity, refilled_at=timezone.now()
+                )
+            except IntegrityError:
+                # Another worker created it first
+                bucket = QuotaBucket.objects.get(name=self.BUCKET_NAME)
+        return bucket
+
+    def _publish(self, tokens: float):
+        quota_tokens.set(tokens)
+        quota_utilization.set(1 - tokens / self.capacity)
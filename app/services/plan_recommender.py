@@ -0,0 +1,116 @@
+import heapq
+from decimal import Decimal
+from typing import Dict, List
+from .rate_calculator import RateCalculator
+
+class PlanRecommender:
+    """
+    Ranks rate plans by first-year cost. Every plan gets a cheap lower bound
+    (lowest tier rate x annual kWh + fixed charges), and plans are fully
+    costed in order of that bound until no remaining bound can beat the
+    k-th cheapest plan found so far.
+    """
+    # Costs are rounded to cents, so bounds are lowered by that much to stay safe
+    ROUNDING_SLACK = 0.01
+
+    def __init__(self, calculator: RateCalculator = None):
+        self.calculator = calculator or RateCalculator()
+
+    def lower_bound(self, rate_info: Dict, yearly_consumption: float) -> float:
+        """A first-year cost the calculator can never undercut for this plan"""
+        try:
+            fixed_charge = self.calculator._calculate_annual_fixed_charge(
+                float(rate_info['fixedchargefirstmeter']),
+                rate_info['fixedchargeunits']
+            )
+
+            rates = []
+            for period in rate_info['energyratestructure']:
+                for tier in period:
+                    rate = tier.get('rate')
+                    # The calculator treats non-numeric rates as free
+                    rates.append(float(rate) if isinstance(rate, (int, float, Decimal)) else 0.0)
+
+            # A schedule the calculator cannot follow makes it fall back to zero energy cost
+            if not self._schedule_resolves(rate_info):
+                rates.append(0.0)
+        except Exception:
+            # The calculator prices plans it cannot read at zero, so always cost them
+            return float('-inf')
+
+        # Negative rates are credits, so the cheapest tier can pull the bound below the fixed charge
+        return min(rates) * yearly_consumption + fixed_charge - self.ROUNDING_SLACK
+
+    @staticmethod
+    def _schedule_resolves(rate_info: Dict) -> bool:
+        """Whether every hour the calculator reads maps to a non-empty period"""
+        try:
+            hours = rate_info['energyweekdayschedule'][0]
+            structure = rate_info['energyratestructure']
+            return all(structure[hours[hour]] for hour in range(24))
+        except (IndexError, KeyError, TypeError):
+            return False
+
+    def first_year_cost(self, rate_info: Dict, yearly_consumption: float) -> float:
+        return self.calculator.calculate_yearly_cost(rate_info, yearly_consumption)[0]
+
+    def recommend(self, rates: List[Dict], yearly_consumption: float, k: int = 3) -> Dict:
+        """
+        Return the k cheapest plans with their savings against the default
+        plan (the first plan flagged is_default, else the first plan)
+        """
+        if not rates:
+            return {'recommendations': [], 'default': None, 'evaluated': 0, 'pruned': 0}
+
+        default_rate = next((r for r in rates if r['is_default']), rates[0])
+        candidates = sorted(
+            (self.lower_bound(rate, yearly_consumption), index)
+            for index, rate in enumerate(rates)
+        )
+
+        costs: Dict[int, float] = {}
+        best: List = []  # max-heap of (-cost, -index) holding the k cheapest
+        for bound, index in candidates:
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            cost = self.first_year_cost(rates[index], yearly_consumption)
+            costs[index] = cost
+            entry = (-cost, -index)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+        default_index = rates.index(default_rate)
+        default_cost = costs.get(default_index)
+        if default_cost is None:
+            default_cost = self.first_year_cost(default_rate, yearly_consumption)
+
+        ranked = sorted((-neg_cost, -neg_index) for neg_cost, neg_index in best)
+        return {
+            'recommendations': [
+                self._describe(rank, rates[index], cost, default_cost, yearly_consumption)
+                for rank, (cost, index) in enumerate(ranked, start=1)
+            ],
+            'default': {
+                'label': default_rate['label'],
+                'name': default_rate['name'],
+                'first_year_cost': default_cost,
+            },
+            'evaluated': len(costs),
+            'pruned': len(rates) - len(costs),
+        }
+
+    def _describe(self, rank: int, rate_info: Dict, cost: float,
+                  default_cost: float, yearly_consumption: float) -> Dict:
+        savings = round(default_cost - cost, 2)
+        return {
+            'rank': rank,
+            'label': rate_info['label'],
+            'name': rate_info['name'],
+            'utility': rate_info['utility'],
+            'first_year_cost': cost,
+            'effective_rate': round(cost / yearly_consumption * 100, 2) if yearly_consumption else 0.0,
+            'savings_vs_default': savings,
+            'savings_pct': round(savings / default_cost * 100, 2) if default_cost else 0.0,
+        }
@@ -0,0 +1,238 @@
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from .rate_calculator import RateCalculator
+
+logger = logging.getLogger(__name__)
+
+class QuoteGrid:
+    """
+    Precomputed quotes for one tariff over the consumption x escalator
+    input space allowed by InputValidator
+    """
+    CONSUMPTIONS = np.arange(1000, 10001, 250, dtype=float)  # kWh/year
+    ESCALATORS = np.arange(4.0, 10.01, 0.5)  # %/year
+    YEARS = 20
+
+    def __init__(self, daily_costs: np.ndarray, effective_rates: np.ndarray, projections: np.ndarray):
+        self.daily_costs = daily_costs  # (consumption,)
+        self.effective_rates = effective_rates  # (consumption,)
+        self.projections = projections  # (consumption, escalator, year)
+
+    @staticmethod
+    def tariff_key(rate_info: Dict, load_curve: str) -> str:
+        """
+        Hash of every input the calculator reads, so changed tariffs get new
+        grids. repr() is used instead of canonical JSON because it is several
+        times faster, and equal reprs always mean equal content. load_curve
+        is the repr of the calculator's curve, computed once by the caller.
+        """
+        return hashlib.sha256(repr((
+            rate_info['energyratestructure'],
+            rate_info['energyweekdayschedule'],
+            str(rate_info['fixedchargefirstmeter']),
+            rate_info['fixedchargeunits'],
+            load_curve,
+        )).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def build(cls, rate_info: Dict, calculator: RateCalculator) -> 'QuoteGrid':
+        structure = rate_info['energyratestructure']
+        schedule = rate_info['energyweekdayschedule']
+        daily_costs = np.empty(len(cls.CONSUMPTIONS))
+        effective_rates = np.empty(len(cls.CONSUMPTIONS))
+        projections = np.empty((len(cls.CONSUMPTIONS), len(cls.ESCALATORS), cls.YEARS))
+
+        for i, consumption in enumerate(cls.CONSUMPTIONS):
+            daily_consumption = consumption / 365
+            daily_costs[i] = calculator.calculate_daily_cost(structure, schedule, daily_consumption)
+            effective_rates[i] = calculator.calculate_average_rate(structure, schedule, daily_consumption)
+            for j, escalator in enumerate(cls.ESCALATORS):
+                projections[i, j] = calculator.calculate_yearly_cost(rate_info, consumption, escalator)
+
+        return cls(daily_costs, effective_rates, projections)
+
+    def lookup(self, consumption: float, escalator: float, interpolate: bool = False) -> Optional[Dict]:
+        """
+        Quote from the grid. Off-grid inputs are bilinearly interpolated when
+        interpolate is set, otherwise None is returned so the caller can
+        fall back to the calculator.
+        """
+        c_pos = self._position(self.CONSUMPTIONS, consumption)
+        e_pos = self._position(self.ESCALATORS, escalator)
+        if c_pos is None or e_pos is None:
+            return None
+
+        exact = c_pos == int(c_pos) and e_pos == int(e_pos)
+        if exact:
+            i, j = int(c_pos), int(e_pos)
+            yearly_costs = self.projections[i, j].tolist()
+            return {
+                'yearly_costs': yearly_costs,
+                'first_year_cost': yearly_costs[0],
+                'effective_rate': float(self.effective_rates[i]),
+                'daily_cost': float(self.daily_costs[i]),
+                'exact': True,
+            }
+        if not interpolate:
+            return None
+
+        c_low, c_high, c_weight = self._neighbours(c_pos, len(self.CONSUMPTIONS))
+        e_low, e_high, e_weight = self._neighbours(e_pos, len(self.ESCALATORS))
+
+        projection = (
+            self.projections[c_low, e_low] * (1 - c_weight) * (1 - e_weight)
+            + self.projections[c_high, e_low] * c_weight * (1 - e_weight)
+            + self.projections[c_low, e_high] * (1 - c_weight) * e_weight
+            + self.projections[c_high, e_high] * c_weight * e_weight
+        )
+        yearly_costs = [round(float(cost), 2) for cost in projection]
+        return {
+            'yearly_costs': yearly_costs,
+            'first_year_cost': yearly_costs[0],
+            'effective_rate': round(float(
+                self.effective_rates[c_low] * (1 - c_weight) + self.effective_rates[c_high] * c_weight
+            ), 2),
+            'daily_cost': float(self.daily_costs[c_low] * (1 - c_weight) + self.daily_costs[c_high] * c_weight),
+            'exact': False,
+        }
+
+    def verify(self, rate_info: Dict, calculator: RateCalculator, samples: int = 200, seed: int = 0) -> Dict:
+        """
+        Compare the grid with the live calculator: every grid point must match
+        exactly, and random off-grid points report the interpolation error
+        """
+        mismatches = 0
+        for consumption in self.CONSUMPTIONS:
+            for escalator in self.ESCALATORS:
+                expected = calculator.calculate_yearly_cost(rate_info, consumption, escalator)
+                if self.lookup(consumption, escalator)['yearly_costs'] != expected:
+                    mismatches += 1
+
+        rng = np.random.default_rng(seed)
+        max_error = 0.0
+        errors = []
+        for _ in range(samples):
+            consumption = float(rng.integers(1000, 10001))
+            escalator = round(float(rng.uniform(4, 10)), 1)
+            expected = calculator.calculate_yearly_cost(rate_info, consumption, escalator)
+            quoted = self.lookup(consumption, escalator, interpolate=True)['yearly_costs']
+            # Free plans have no cost to take a relative error against
+            error = max((abs(q - e) / e * 100 for q, e in zip(quoted, expected) if e), default=0.0)
+            errors.append(error)
+            max_error = max(max_error, error)
+
+        return {
+            'grid_points': len(self.CONSUMPTIONS) * len(self.ESCALATORS),
+            'grid_mismatches': mismatches,
+            'interpolation_samples': samples,
+            'max_interpolation_error_pct': round(max_error, 4),
+            'mean_interpolation_error_pct': round(float(np.mean(errors)), 4) if errors else 0.0,
+        }
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            daily_costs=self.daily_costs,
+            effective_rates=self.effective_rates,
+            projections=self.projections
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'QuoteGrid':
+        with np.load(io.BytesIO(payload)) as arrays:
+            return cls(arrays['daily_costs'], arrays['effective_rates'], arrays['projections'])
+
+    @staticmethod
+    def _position(axis: np.ndarray, value: float) -> Optional[float]:
+        """Fractional index of value along an evenly spaced axis, None if outside"""
+        start = float(axis[0])
+        step = float(axis[1]) - start
+        position = (value - start) / step
+        if position < -1e-9 or position > len(axis) - 1 + 1e-9:
+            return None
+        rounded = round(position)
+        return float(rounded) if abs(position - rounded) < 1e-9 else position
+
+    @staticmethod
+    def _neighbours(position: float, size: int):
+        low = min(int(position), size - 1)
+        high = min(low + 1, size - 1)
+        return low, high, position - low
+
+class QuoteGridStore:
+    """
+    Keeps quote grids in the shared cache, keyed by tariff content hash,
+    and builds them on a background worker so requests never wait for one
+    """
+    CACHE_PREFIX = 'quote_grid:'
+    # Decoded grids kept in process so hot tariffs skip cache reads and decompression
+    LOCAL_SIZE = 256
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quote-grid')
+    _pending = set()
+    _local: 'OrderedDict[str, QuoteGrid]' = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, calculator: RateCalculator = None):
+        self.calculator = calculator or RateCalculator()
+        self.load_curve = repr(self.calculator.load_curve)
+
+    def get(self, rate_info: Dict) -> Optional[QuoteGrid]:
+        key = QuoteGrid.tariff_key(rate_info, self.load_curve)
+        with self._lock:
+            grid = self._local.get(key)
+            if grid is not None:
+                self._local.move_to_end(key)
+                return grid
+
+        payload = cache.get(self.CACHE_PREFIX + key)
+        if payload is None:
+            return None
+        grid = QuoteGrid.from_bytes(payload)
+        self._remember(key, grid)
+        return grid
+
+    def build(self, rate_info: Dict) -> QuoteGrid:
+        key = QuoteGrid.tariff_key(rate_info, self.load_curve)
+        grid = QuoteGrid.build(rate_info, self.calculator)
+        cache.set(self.CACHE_PREFIX + key, grid.to_bytes(), settings.QUOTE_GRID_TTL)
+        self._remember(key, grid)
+        return grid
+
+    def _remember(self, key: str, grid: QuoteGrid):
+        with self._lock:
+            self._local[key] = grid
+            self._local.move_to_end(key)
+            while len(self._local) > self.LOCAL_SIZE:
+                self._local.popitem(last=False)
+
+    def schedule(self, rates: Iterable[Dict]) -> List[str]:
+        """Queue grid builds for tariffs without one, returns the queued keys"""
+        queued = []
+        for rate_info in rates:
+            key = QuoteGrid.tariff_key(rate_info, self.load_curve)
+            with self._lock:
+                if key in self._pending or cache.get(self.CACHE_PREFIX + key) is not None:
+                    continue
+                self._pending.add(key)
+            self._executor.submit(self._build_pending, key, rate_info)
+            queued.append(key)
+        return queued
+
+    def _build_pending(self, key: str, rate_info: Dict):
+        try:
+            self.build(rate_info)
+        except Exception as e:
+            logger.error(f"Error building quote grid for {rate_info.get('label')}: {str(e)}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
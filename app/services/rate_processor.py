@@ -1,26 +1,61 @@
 import logging
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
+from ..metrics import registry
 
 logger = logging.getLogger(__name__)
 
+memo_lookups = registry.counter(
+    'solarate_rate_processor_memo_total',
+    'Processed tariff memo lookups and evictions by result'
+)
+memo_size = registry.gauge(
+    'solarate_rate_processor_memo_entries',
+    'Processed tariffs held in the memo'
+)
+
 class RateProcessor:
     """Processes raw rate data into standardized format"""
-    def process_rate_data(self, api_data: Dict) -> List[Dict]:
+    # Processed tariffs by content hash of the raw item, shared by every instance
+    MEMO_SIZE = 1024
+    _memo: 'OrderedDict[str, Dict]' = OrderedDict()
+    _memo_lock = threading.Lock()
+
+    def process_rate_data(self, api_data: Dict, as_of: Optional[datetime] = None) -> List[Dict]:
+        """
+        Standardize the tariffs in effect on as_of (now by default). When
+        api_data carries item_hashes (see ResolvingRateProvider), unchanged
+        tariffs are reused from the memo instead of processed again.
+        """
         processed_rates = []
-        cutoff_date = datetime(2021, 12, 31).timestamp()
+        effective_at = (as_of or datetime.now()).timestamp()
+
+        raw_items = api_data.get('items', [])
+        item_hashes = api_data.get('item_hashes')
+        if item_hashes is None or len(item_hashes) != len(raw_items):
+            item_hashes = [None] * len(raw_items)
 
         # Sort items by is_default to ensure default rates appear first
         items = sorted(
-            api_data.get('items', []),
-            key=lambda x: (not x.get('is_default', False), x.get('startdate', 0))
+            zip(raw_items, item_hashes),
+            key=lambda pair: (not pair[0].get('is_default', False), pair[0].get('startdate', 0))
         )
 
-        for item in items:
-            if item.get('enddate') and item['enddate'] < cutoff_date:
+        for item, item_hash in items:
+            if item.get('startdate') and item['startdate'] > effective_at:
+                continue
+            if item.get('enddate') and item['enddate'] <= effective_at:
                 continue
 
+            if item_hash is not None:
+                rate_info = self._memo_get(item_hash)
+                if rate_info is not None:
+                    processed_rates.append(rate_info)
+                    continue
+
             try:
                 avg_rate = self.calculate_rate(item)
                 rate_info = self._extract_rate_info(item, avg_rate)
@@ -28,6 +63,8 @@ class RateProcessor:
                 # Only add valid rates (with required fields)
                 if rate_info['label'] and rate_info['name'] and rate_info['utility']:
                     processed_rates.append(rate_info)
+                    if item_hash is not None:
+                        self._memo_put(item_hash, rate_info)
                 else:
                     logger.warning(f"Skipping rate with missing required fields: {item.get('name')}")
 
@@ -37,6 +74,28 @@ class RateProcessor:
 
         return processed_rates
 
+    @classmethod
+    def _memo_get(cls, item_hash: str) -> Optional[Dict]:
+        with cls._memo_lock:
+            rate_info = cls._memo.get(item_hash)
+            if rate_info is None:
+                memo_lookups.inc(result='miss')
+                return None
+            cls._memo.move_to_end(item_hash)
+        memo_lookups.inc(result='hit')
+        # Callers annotate the dicts they get back, so never hand out the memoized one
+        return rate_info.copy()
+
+    @classmethod
+    def _memo_put(cls, item_hash: str, rate_info: Dict):
+        with cls._memo_lock:
+            cls._memo[item_hash] = rate_info.copy()
+            cls._memo.move_to_end(item_hash)
+            while len(cls._memo) > cls.MEMO_SIZE:
+                cls._memo.popitem(last=False)
+                memo_lookups.inc(result='eviction')
+            memo_size.set(len(cls._memo))
+
     def _extract_rate_info(self, item: Dict, avg_rate: float) -> Dict:
         """Extract and validate rate information from API response"""
         try:
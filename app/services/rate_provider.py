@@ -2,9 +2,16 @@ from abc import ABC, abstractmethod
 import logging
 from typing import Dict, List
 import requests
+from ..metrics import registry
+from .openei_quota import OpenEIQuota, QuotaExceeded
 
 logger = logging.getLogger(__name__)
 
+upstream_requests = registry.counter(
+    'solarate_openei_requests_total',
+    'OpenEI API requests by response status'
+)
+
 class RateDataProvider(ABC):
     """Abstract interface for rate data providers"""
     @abstractmethod
@@ -14,33 +21,69 @@ class RateDataProvider(ABC):
 class OpenEIRateProvider(RateDataProvider):
     """Implementation of RateDataProvider for OpenEI API"""
     OPENEI_BASE_URL = "https://api.openei.org/utility_rates"
-    
-    def __init__(self, api_key: str):
+    # Used when a 429 response carries no usable Retry-After header
+    DEFAULT_RETRY_AFTER = 60
+
+    def __init__(self, api_key: str, base_url: str = None, quota: OpenEIQuota = None):
         self.api_key = api_key
+        self.base_url = base_url or self.OPENEI_BASE_URL
+        self.quota = quota
         if not self.api_key:
             logger.error("OPENEI_API_KEY not configured")
 
     def get_utility_rates(self, address: str) -> List[Dict]:
+        return self._fetch({'address': address})
+
+    def get_utility_rates_by_utility(self, utility_id: int) -> List[Dict]:
+        """Fetch the tariffs of one utility by its EIA ID"""
+        return self._fetch({'ei': utility_id})
+
+    def get_rate_by_label(self, label: str) -> List[Dict]:
+        """Fetch the latest revision of one tariff, default or not"""
+        return self._fetch({'getpage': label}, only_default=False)
+
+    def get_utility_ids(self, address: str) -> List[int]:
+        """EIA IDs of the utilities serving an address, from a minimal-detail lookup"""
+        data = self._fetch({'address': address}, detail='minimal')
+        return sorted({item['eiaid'] for item in data.get('items', []) if item.get('eiaid') is not None})
+
+    def _fetch(self, query: Dict, only_default: bool = True, detail: str = 'full') -> List[Dict]:
         try:
             params = {
                 'api_key': self.api_key,
-                'address': address,
+                **query,
                 'format': 'json',
                 'version': 'latest',
                 'approved': 'true',
-                'is_default': 'true',
                 'limit': 50,
-                'detail': 'full'
+                'detail': detail
             }
-            
-            response = requests.get(
-                self.OPENEI_BASE_URL,
-                params=params,
-                timeout=10
-            )
-            
+            if only_default:
+                params['is_default'] = 'true'
+
+            if self.quota:
+                self.quota.acquire()
+
+            try:
+                response = requests.get(
+                    self.base_url,
+                    params=params,
+                    timeout=10
+                )
+            except requests.RequestException:
+                upstream_requests.inc(status='error')
+                raise
+
+            upstream_requests.inc(status=str(response.status_code))
             if response.status_code == 200:
                 return response.json()
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After', '')
+                retry_after = float(retry_after) if retry_after.isdigit() else self.DEFAULT_RETRY_AFTER
+                # Every worker shares the key, so stop them all until upstream accepts calls again
+                if self.quota:
+                    self.quota.drain(retry_after)
+                raise QuotaExceeded(retry_after)
             raise requests.RequestException(f"API error: {response.status_code}")
                 
         except Exception as e:
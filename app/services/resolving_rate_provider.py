@@ -0,0 +1,203 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Union
+from django.conf import settings
+from django.core.cache import cache
+from ..hashing import content_hash
+from ..metrics import registry
+from ..repositories.location_repository import LocationRepository
+from .location_resolver import Location, LocationResolver, get_location_resolver
+from .openei_quota import OpenEIQuota
+from .rate_provider import OpenEIRateProvider, RateDataProvider
+from .tariff_refresh import TariffRefreshScheduler, get_refresh_scheduler
+
+logger = logging.getLogger(__name__)
+
+cache_lookups = registry.counter(
+    'solarate_provider_cache_total',
+    'Tariff cache lookups by cache and result'
+)
+
+class ResolvingRateProvider(RateDataProvider):
+    """
+    Resolves addresses to a geocell and serves tariffs per utility from a
+    shared cache. A cell can span several utilities, so once tariffs for a
+    cell are cached, a new address in it only costs a minimal-detail
+    lookup confirming which utilities serve it; the tariffs themselves come
+    from the per-utility cache.
+
+    Cache entries are served stale-while-revalidate: after cache_ttl an
+    entry is still returned for up to stale_ttl while the refresh scheduler
+    re-fetches it, and popular entries are refreshed before they expire.
+    on_items_fetched is called with the tariffs that are new or changed
+    after each fetch so derived data is rebuilt only when needed.
+    """
+    UTILITY_CACHE_PREFIX = 'openei:utility:'
+    ADDRESS_CACHE_PREFIX = 'openei:address:'
+    CONFIRMED_CACHE_PREFIX = 'openei:address-utilities:'
+
+    def __init__(self,
+                 provider: OpenEIRateProvider,
+                 resolver: LocationResolver,
+                 cache_ttl: int = None,
+                 on_items_fetched: Optional[Callable[[List[Dict]], None]] = None,
+                 scheduler: TariffRefreshScheduler = None):
+        self.provider = provider
+        self.resolver = resolver
+        self.cache_ttl = cache_ttl or settings.OPENEI_CACHE_TTL
+        self.stale_ttl = settings.OPENEI_STALE_TTL
+        self.refresh_ahead = settings.OPENEI_REFRESH_AHEAD
+        self.on_items_fetched = on_items_fetched
+        self.scheduler = scheduler or get_refresh_scheduler()
+        self.location_repository = LocationRepository()
+
+    @classmethod
+    def from_settings(cls, on_items_fetched: Optional[Callable[[List[Dict]], None]] = None) -> 'ResolvingRateProvider':
+        """OpenEI behind the configured quota, resolver and cache settings"""
+        return cls(
+            OpenEIRateProvider(
+                settings.OPENEI_API_KEY,
+                settings.OPENEI_BASE_URL,
+                OpenEIQuota.from_settings()
+            ),
+            get_location_resolver(),
+            on_items_fetched=on_items_fetched
+        )
+
+    def get_utility_rates(self, address: str) -> Dict:
+        location = self.resolver.resolve(address)
+
+        known_ids = self.location_repository.get_utility_ids(location.cell) if location.cell else []
+        utility_ids = self._confirm_utility_ids(address, location) if known_ids else []
+        if utility_ids:
+            if not set(utility_ids) <= set(known_ids):
+                self.location_repository.remember_utility_ids(location.cell, utility_ids)
+            items = []
+            item_hashes = []
+            for utility_id in utility_ids:
+                entry = self._get_utility_entry(utility_id)
+                items.extend(entry['data'])
+                item_hashes.extend(entry['item_hashes'])
+            return {'items': items, 'item_hashes': item_hashes}
+
+        entry = self._get_address_entry(address, location)
+        # Hashes are computed once per fetch and let RateProcessor reuse processed tariffs
+        return {**entry['data'], 'item_hashes': entry['item_hashes']}
+
+    def _confirm_utility_ids(self, address: str, location: Location) -> List[int]:
+        """
+        Utilities OpenEI says serve this address, never guessed from the cell.
+        Empty when the lookup names none, so the caller falls back to a full
+        address fetch.
+        """
+        cache_key = self.CONFIRMED_CACHE_PREFIX + content_hash(location.canonical)
+        utility_ids = cache.get(cache_key)
+        if utility_ids is not None:
+            cache_lookups.inc(cache='confirm', result='hit')
+            return utility_ids
+
+        cache_lookups.inc(cache='confirm', result='miss')
+        utility_ids = self.provider.get_utility_ids(address)
+        cache.set(cache_key, utility_ids, self.cache_ttl + self.stale_ttl)
+        return utility_ids
+
+    def _get_utility_entry(self, utility_id: int) -> Dict:
+        return self._cached(
+            'utility',
+            f"{self.UTILITY_CACHE_PREFIX}{utility_id}",
+            lambda: self.provider.get_utility_rates_by_utility(utility_id).get('items', [])
+        )
+
+    def _get_address_entry(self, address: str, location: Location) -> Dict:
+        return self._cached(
+            'address',
+            self.ADDRESS_CACHE_PREFIX + content_hash(location.canonical),
+            lambda: self._fetch_address(address, location)
+        )
+
+    def _fetch_address(self, address: str, location: Location) -> Dict:
+        data = self.provider.get_utility_rates(address)
+
+        # Seed the per-utility cache and remember who serves this cell
+        by_utility = defaultdict(list)
+        for item in data.get('items', []):
+            if item.get('eiaid') is not None:
+                by_utility[item['eiaid']].append(item)
+        for utility_id, items in by_utility.items():
+            cache.add(
+                f"{self.UTILITY_CACHE_PREFIX}{utility_id}",
+                self._entry(items),
+                self.cache_ttl + self.stale_ttl
+            )
+        if location.cell and by_utility:
+            self.location_repository.remember_utility_ids(location.cell, by_utility.keys())
+            # This fetch already names the address's utilities, so repeats need no confirming lookup
+            cache.set(
+                self.CONFIRMED_CACHE_PREFIX + content_hash(location.canonical),
+                sorted(by_utility),
+                self.cache_ttl + self.stale_ttl
+            )
+
+        return data
+
+    def _cached(self, kind: str, cache_key: str, fetch: Callable[[], Union[Dict, List]]):
+        self.scheduler.record_access(cache_key)
+        entry = cache.get(cache_key)
+
+        if entry is None:
+            cache_lookups.inc(cache=kind, result='miss')
+            return self._store(cache_key, fetch(), None)
+
+        age = time.time() - entry['fetched_at']
+        if age >= self.cache_ttl:
+            cache_lookups.inc(cache=kind, result='stale')
+            self._schedule_refresh(cache_key, fetch)
+        else:
+            cache_lookups.inc(cache=kind, result='hit')
+            if age >= self.cache_ttl * self.refresh_ahead and self.scheduler.is_hot(cache_key):
+                self._schedule_refresh(cache_key, fetch)
+        return entry
+
+    def _schedule_refresh(self, cache_key: str, fetch: Callable[[], Union[Dict, List]]):
+        def refresh() -> str:
+            previous = cache.get(cache_key)
+            entry = self._store(cache_key, fetch(), previous)
+            if previous and previous['hash'] == entry['hash']:
+                return 'unchanged'
+            return 'changed'
+
+        self.scheduler.request(cache_key, refresh)
+
+    def _store(self, cache_key: str, data: Union[Dict, List], previous: Optional[Dict]) -> Dict:
+        entry = self._entry(data)
+        cache.set(cache_key, entry, self.cache_ttl + self.stale_ttl)
+
+        known = set(previous['item_hashes']) if previous else set()
+        changed = [
+            item for item, item_hash in zip(self._items(data), entry['item_hashes'])
+            if item_hash not in known
+        ]
+        self._notify(changed)
+        return entry
+
+    def _entry(self, data: Union[Dict, List]) -> Dict:
+        item_hashes = [content_hash(item) for item in self._items(data)]
+        return {
+            'data': data,
+            'fetched_at': time.time(),
+            'hash': content_hash(item_hashes),
+            'item_hashes': item_hashes,
+        }
+
+    @staticmethod
+    def _items(data: Union[Dict, List]) -> List[Dict]:
+        return data if isinstance(data, list) else data.get('items', [])
+
+    def _notify(self, items: List[Dict]):
+        if not self.on_items_fetched or not items:
+            return
+        try:
+            self.on_items_fetched(items)
+        except Exception as e:
+            logger.error(f"Error handling fetched tariffs: {str(e)}")
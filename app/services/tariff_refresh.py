@@ -0,0 +1,122 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict
+from django.db import close_old_connections
+from ..metrics import registry
+from .openei_quota import REFRESH, quota_priority
+
+logger = logging.getLogger(__name__)
+
+refresh_runs = registry.counter(
+    'solarate_tariff_refresh_total',
+    'Background tariff refreshes by outcome'
+)
+refresh_queue_size = registry.gauge(
+    'solarate_tariff_refresh_queue',
+    'Tariff cache entries waiting for a background refresh'
+)
+
+class TariffRefreshScheduler:
+    """
+    Re-fetches tariff cache entries on a background thread, most accessed
+    entries first, without exceeding budget_per_minute upstream calls.
+    Access counts are halved periodically so popularity follows recent
+    traffic.
+    """
+    DECAY_EVERY = 10000
+
+    def __init__(self, budget_per_minute: float = 30, hot_threshold: int = 5):
+        self.budget_per_minute = budget_per_minute
+        self.hot_threshold = hot_threshold
+        self._counts: Counter = Counter()
+        self._accesses = 0
+        self._pending: Dict[str, Callable[[], str]] = {}
+        self._queue = []
+        self._sequence = itertools.count()
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def record_access(self, key: str):
+        with self._condition:
+            self._counts[key] += 1
+            self._accesses += 1
+            if self._accesses >= self.DECAY_EVERY:
+                self._accesses = 0
+                self._counts = Counter({k: v // 2 for k, v in self._counts.items() if v > 1})
+
+    def is_hot(self, key: str) -> bool:
+        return self._counts.get(key, 0) >= self.hot_threshold
+
+    def request(self, key: str, job: Callable[[], str]) -> bool:
+        """
+        Queue job to refresh key unless it is already queued. job returns
+        'changed' or 'unchanged' for the metrics.
+        """
+        with self._condition:
+            if key in self._pending:
+                return False
+            self._pending[key] = job
+            heapq.heappush(self._queue, (-self._counts.get(key, 0), next(self._sequence), key))
+            refresh_queue_size.set(len(self._queue))
+            self._ensure_running()
+            self._condition.notify()
+            return True
+
+    def _ensure_running(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='tariff-refresh', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                self._wait_for_budget()
+                _, _, key = heapq.heappop(self._queue)
+                job = self._pending.get(key)
+                refresh_queue_size.set(len(self._queue))
+
+            try:
+                with quota_priority(REFRESH):
+                    refresh_runs.inc(outcome=job())
+            except Exception as e:
+                refresh_runs.inc(outcome='error')
+                logger.error(f"Error refreshing {key}: {str(e)}")
+            finally:
+                with self._condition:
+                    self._pending.pop(key, None)
+                close_old_connections()
+
+    def _wait_for_budget(self):
+        """Token bucket over upstream calls, called with the condition held"""
+        rate = self.budget_per_minute / 60
+        while True:
+            now = time.monotonic()
+            self._tokens = min(1.0, self._tokens + (now - self._refilled_at) * rate)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            self._condition.wait((1 - self._tokens) / rate)
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_refresh_scheduler() -> TariffRefreshScheduler:
+    """Process-wide scheduler configured from settings"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            from django.conf import settings
+            _scheduler = TariffRefreshScheduler(
+                settings.OPENEI_REFRESH_BUDGET,
+                settings.OPENEI_HOT_THRESHOLD
+            )
+        return _scheduler
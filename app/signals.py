@@ -0,0 +1,70 @@
+import logging
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Project, ProposalUtility
+from .repositories.analytics_repository import AnalyticsRepository
+
+logger = logging.getLogger(__name__)
+
+# Proposal fields the running totals are keyed or summed on
+TRACKED_FIELDS = ('project_id', 'openei_id', 'rate_name', 'utility', 'average_rate', 'first_year_cost')
+
+@receiver(pre_save, sender=ProposalUtility)
+def remember_stored_proposal(sender, instance, raw=False, **kwargs):
+    """Keep the stored row of an updated proposal so its old values can be taken out"""
+    instance._analytics_previous = None
+    if instance.pk and not raw:
+        instance._analytics_previous = ProposalUtility.objects.select_related('project').filter(pk=instance.pk).first()
+
+@receiver(post_save, sender=ProposalUtility)
+def add_proposal_to_analytics(sender, instance, created, **kwargs):
+    """Count saved proposals in the running analytics totals, replacing the old values on update"""
+    previous = getattr(instance, '_analytics_previous', None)
+    if not created and (previous is None or all(
+        getattr(previous, field) == getattr(instance, field) for field in TRACKED_FIELDS
+    )):
+        return
+    try:
+        with transaction.atomic():
+            if not created:
+                AnalyticsRepository.record([previous], sign=-1)
+            AnalyticsRepository.record([instance])
+    except Exception as e:
+        logger.error(f"Error updating analytics for proposal {instance.pk}: {str(e)}")
+
+@receiver(post_delete, sender=ProposalUtility)
+def remove_proposal_from_analytics(sender, instance, **kwargs):
+    """Take deleted proposals back out of the running analytics totals"""
+    try:
+        AnalyticsRepository.record([instance], sign=-1)
+    except Exception as e:
+        logger.error(f"Error updating analytics for proposal {instance.pk}: {str(e)}")
+
+@receiver(pre_save, sender=Project)
+def remember_stored_consumption(sender, instance, raw=False, **kwargs):
+    """Keep the stored consumption of an updated project"""
+    instance._analytics_consumption = None
+    if instance.pk and not raw:
+        instance._analytics_consumption = Project.objects.filter(pk=instance.pk).values_list(
+            'consumption', flat=True
+        ).first()
+
+@receiver(post_save, sender=Project)
+def move_project_consumption(sender, instance, created, **kwargs):
+    """Move the project's proposal to its new consumption in the running totals"""
+    consumption = getattr(instance, '_analytics_consumption', None)
+    if created or consumption is None or consumption == instance.consumption:
+        return
+    try:
+        proposal = ProposalUtility.objects.filter(project_id=instance.pk).first()
+        if proposal is None:
+            return
+        with transaction.atomic():
+            proposal.project = Project(pk=instance.pk, consumption=consumption)
+            AnalyticsRepository.record([proposal], sign=-1)
+            proposal.project = instance
+            AnalyticsRepository.record([proposal])
+    except Exception as e:
+        logger.error(f"Error updating analytics for project {instance.pk}: {str(e)}")
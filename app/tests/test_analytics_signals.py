@@ -0,0 +1,81 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from app.models import Project, ProposalUtility, RateAnalytics
+from app.repositories.analytics_repository import AnalyticsRepository
+
+
+class AnalyticsSignalTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('analyst')
+        self.project = Project.objects.create(
+            user=user, name='Home', description='Roof', address='1 Main St', consumption=5000, percentage=4.0
+        )
+        self.proposal = ProposalUtility.objects.create(
+            project=self.project, openei_id='plan-a', rate_name='Plan A', utility='Utility',
+            average_rate=12.0, first_year_cost=600.0
+        )
+
+    def _summary(self, key='plan-a'):
+        return AnalyticsRepository.get_summary(RateAnalytics.DIMENSION_PLAN, key)
+
+    def test_proposal_update_replaces_old_values(self):
+        self.proposal.first_year_cost = 800.0
+        self.proposal.average_rate = 16.0
+        self.proposal.save()
+
+        summary = self._summary()
+        self.assertEqual(summary['quote_count'], 1)
+        self.assertEqual(summary['average_first_year_cost'], 800.0)
+        self.assertEqual(summary['average_rate'], 16.0)
+
+    def test_plan_change_moves_the_quote(self):
+        self.proposal.openei_id = 'plan-b'
+        self.proposal.rate_name = 'Plan B'
+        self.proposal.save()
+
+        self.assertEqual(self._summary()['quote_count'], 0)
+        self.assertEqual(self._summary('plan-b')['quote_count'], 1)
+        utility = AnalyticsRepository.get_summary(RateAnalytics.DIMENSION_UTILITY, 'Utility')
+        self.assertEqual(utility['quote_count'], 1)
+
+    def test_consumption_change_moves_the_totals(self):
+        self.project.consumption = 9000
+        self.project.save()
+
+        summary = self._summary()
+        self.assertEqual(summary['average_consumption'], 9000.0)
+        self.assertEqual(sum(bucket['count'] for bucket in summary['consumption_histogram']), 1)
+        self.assertEqual(
+            RateAnalytics.objects.get(dimension=RateAnalytics.DIMENSION_PLAN, key='plan-a').consumption_histogram[
+                RateAnalytics.consumption_bucket(9000)
+            ],
+            1
+        )
+
+    def test_matches_rebuild(self):
+        self.proposal.first_year_cost = 750.0
+        self.proposal.save()
+        self.project.consumption = 2000
+        self.project.save()
+        self.proposal.save()
+        incremental = self._summary()
+
+        AnalyticsRepository.rebuild()
+        self.assertEqual(self._summary(), incremental)
+
+
+class AnalyticsViewTests(TestCase):
+    def test_anonymous_request_is_rejected(self):
+        self.assertIn(self.client.get('/api/analytics/').status_code, (401, 403))
+
+    def test_non_staff_user_is_rejected(self):
+        self.client.force_login(User.objects.create_user('installer'))
+        self.assertEqual(self.client.get('/api/analytics/').status_code, 403)
+
+    def test_staff_user_reads_totals(self):
+        self.client.force_login(User.objects.create_user('operator', is_staff=True))
+        response = self.client.get('/api/analytics/?dimension=utility')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'results': []})
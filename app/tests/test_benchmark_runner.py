@@ -0,0 +1,32 @@
+import logging
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from app.benchmarks import BenchmarkRunner
+from app.benchmarks.runner import BENCHMARK_CACHES, TARIFF_CACHE_PREFIX
+
+
+class BenchmarkRunnerTests(SimpleTestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_run_leaves_configured_cache_alone(self):
+        cache.set('openei:live', 'kept')
+        self.addCleanup(cache.delete, 'openei:live')
+
+        result = BenchmarkRunner(iterations=1).run_fixture('small')
+
+        self.assertEqual(result['tariffs'], 1)
+        self.assertEqual(cache.get('openei:live'), 'kept')
+
+    @override_settings(CACHES=BENCHMARK_CACHES)
+    def test_delete_prefix_drops_only_tariff_keys(self):
+        cache.set(f'{TARIFF_CACHE_PREFIX}utility:1', 'tariffs')
+        cache.set('location:abc', 'location')
+
+        cache.delete_prefix(TARIFF_CACHE_PREFIX)
+
+        self.assertIsNone(cache.get(f'{TARIFF_CACHE_PREFIX}utility:1'))
+        self.assertEqual(cache.get('location:abc'), 'location')
+        cache.clear()
@@ -0,0 +1,80 @@
+import io
+import json
+import os
+import tempfile
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from app.models import Project, ProposalUtility, Tariff
+
+STRUCTURE = [[{'rate': 0.12}]]
+
+
+class ImportProjectsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='alice')
+        tariff = Tariff.objects.get_or_create_for('L0', STRUCTURE)
+        for i in range(3):
+            project = Project.objects.create(
+                user=self.user, name=f"P{i}", description='', address=f"{i} Main St",
+                consumption=3000, percentage=5
+            )
+            ProposalUtility.objects.create(
+                project=project, openei_id='L0', rate_name='Plan', utility='Utility',
+                average_rate=0.12, first_year_cost=400, tariff=tariff
+            )
+
+        handle, self.path = tempfile.mkstemp(suffix='.ndjson')
+        os.close(handle)
+        call_command('export_projects', output=self.path, stderr=io.StringIO())
+        with open(self.path, encoding='utf-8') as source:
+            self.rows = [json.loads(line) for line in source]
+
+        ProposalUtility.objects.all().delete()
+        Tariff.objects.all().delete()
+        Project.objects.all().delete()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _import(self, lines):
+        with open(self.path, 'w', encoding='utf-8') as target:
+            target.write('\n'.join(lines) + '\n')
+        errors = io.StringIO()
+        call_command('import_projects', self.path, stdout=io.StringIO(), stderr=errors)
+        return errors.getvalue()
+
+    def test_tariff_is_resolved_when_the_row_carrying_it_is_skipped(self):
+        self.assertIsNotNone(self.rows[0]['pricing_matrix'])
+        self.rows[0]['consumption'] = 50
+
+        errors = self._import([json.dumps(row) for row in self.rows])
+
+        self.assertIn('Line 1: Consumption must be between', errors)
+        self.assertEqual(ProposalUtility.objects.count(), 2)
+        self.assertFalse(ProposalUtility.objects.filter(tariff__isnull=True).exists())
+        self.assertEqual(Tariff.objects.get().structure, STRUCTURE)
+
+    def test_unresolvable_tariff_is_reported(self):
+        self.rows[0]['pricing_matrix'] = None
+
+        errors = self._import([json.dumps(row) for row in self.rows])
+
+        self.assertEqual(ProposalUtility.objects.filter(tariff__isnull=True).count(), 3)
+        self.assertIn('Line 1: tariff', errors)
+        self.assertIn('Line 3: tariff', errors)
+
+    def test_malformed_lines_are_skipped(self):
+        self.rows[1]['average_rate'] = 'n/a'
+
+        errors = self._import([
+            json.dumps(self.rows[0]),
+            '{not json',
+            json.dumps(self.rows[1]),
+            json.dumps(self.rows[2]),
+        ])
+
+        self.assertIn('Line 2: Line is not valid JSON', errors)
+        self.assertIn('Line 3: average_rate and first_year_cost must be numbers', errors)
+        self.assertEqual(Project.objects.count(), 2)
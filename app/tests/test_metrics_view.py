@@ -0,0 +1,30 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+
+class MetricsViewTests(TestCase):
+    def test_anonymous_request_is_forbidden(self):
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+
+    def test_non_staff_user_is_forbidden(self):
+        self.client.force_login(User.objects.create_user('installer'))
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+
+    def test_staff_user_reads_metrics(self):
+        self.client.force_login(User.objects.create_user('operator', is_staff=True))
+        response = self.client.get('/api/metrics/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_scraper_token(self):
+        self.assertEqual(
+            self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer scrape-secret').status_code, 200
+        )
+        self.assertEqual(
+            self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403
+        )
+
+    def test_empty_token_never_matches(self):
+        self.assertEqual(self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer ').status_code, 403)
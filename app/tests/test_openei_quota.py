@@ -0,0 +1,67 @@
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import QuotaBucket
+from app.services.openei_quota import BULK, INTERACTIVE, REFRESH, OpenEIQuota, QuotaExceeded
+
+
+class OpenEIQuotaTests(TestCase):
+    def setUp(self):
+        self.quota = OpenEIQuota(100)
+
+    def _fill(self, tokens):
+        self.quota._bucket()
+        QuotaBucket.objects.filter(name=OpenEIQuota.BUCKET_NAME).update(tokens=tokens, refilled_at=timezone.now())
+
+    def _tokens(self):
+        return QuotaBucket.objects.get(name=OpenEIQuota.BUCKET_NAME).tokens
+
+    def test_lower_classes_leave_their_reserve(self):
+        # Refresh must leave 10 tokens and bulk 30, plus the one being taken
+        self._fill(20)
+
+        self.assertGreater(self.quota._try_take(BULK), 0)
+        self.assertIsNone(self.quota._try_take(REFRESH))
+        self.assertIsNone(self.quota._try_take(INTERACTIVE))
+        self.assertAlmostEqual(self._tokens(), 18, places=1)
+
+        self._fill(10.5)
+        self.assertGreater(self.quota._try_take(REFRESH), 0)
+        self.assertIsNone(self.quota._try_take(INTERACTIVE))
+
+    def test_interleaved_take_is_not_overwritten(self):
+        self._fill(50)
+        rival = OpenEIQuota(100)
+        read_bucket = OpenEIQuota._bucket
+        calls = []
+
+        def stale_read(quota):
+            bucket = read_bucket(quota)
+            if not calls:
+                # Another worker takes a token between this read and the swap
+                calls.append(bucket.revision)
+                self.assertIsNone(rival._try_take(INTERACTIVE))
+            return bucket
+
+        with mock.patch.object(OpenEIQuota, '_bucket', stale_read):
+            self.assertIsNone(self.quota._try_take(INTERACTIVE))
+
+        bucket = QuotaBucket.objects.get(name=OpenEIQuota.BUCKET_NAME)
+        self.assertAlmostEqual(bucket.tokens, 48, places=1)
+        self.assertEqual(bucket.revision, calls[0] + 2)
+
+    def test_drain_blocks_until_retry_after(self):
+        quota = OpenEIQuota(36000)
+        quota.drain(30)
+
+        with self.assertRaises(QuotaExceeded) as raised:
+            quota.acquire(INTERACTIVE)
+        self.assertGreater(raised.exception.retry_after, 29)
+
+        # Refilling only starts once the block has passed
+        later = timezone.now() + timedelta(seconds=30.5)
+        with mock.patch('app.services.openei_quota.timezone.now', return_value=later):
+            self.assertIsNone(quota._try_take(INTERACTIVE))
+            self.assertLess(self._tokens(), 5)
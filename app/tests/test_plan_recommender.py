@@ -0,0 +1,74 @@
+import logging
+import random
+from decimal import Decimal
+from django.test import SimpleTestCase
+
+from app.services.plan_recommender import PlanRecommender
+from app.services.rate_calculator import RateCalculator
+
+
+def plan(index, rates, fixed=10.0, schedule=None):
+    return {
+        'label': f"L{index}",
+        'name': f"Plan {index}",
+        'utility': 'Utility',
+        'is_default': index == 0,
+        'energyratestructure': [[{'rate': rate}] for rate in rates],
+        'energyweekdayschedule': schedule if schedule is not None else [[hour % len(rates) for hour in range(24)]] * 12,
+        'fixedchargefirstmeter': Decimal(str(fixed)),
+        'fixedchargeunits': '$/month',
+    }
+
+
+class PlanRecommenderTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The stock load curve logs a normalization warning on every calculator
+        logging.disable(logging.WARNING)
+        cls.calculator = RateCalculator()
+        cls.recommender = PlanRecommender(cls.calculator)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+        super().tearDownClass()
+
+    def _exhaustive(self, rates, consumption, k):
+        costs = sorted(self.calculator.calculate_yearly_cost(rate, consumption)[0] for rate in rates)
+        return costs[:k]
+
+    def test_credit_rate_plan_is_not_pruned(self):
+        rates = [plan(0, [0.0]), plan(1, [-0.02])]
+        result = self.recommender.recommend(rates, 6000, k=1)
+        self.assertEqual(result['recommendations'][0]['label'], 'L1')
+        self.assertEqual(result['recommendations'][0]['first_year_cost'], 0.0)
+
+    def test_matches_exhaustive_ranking(self):
+        generator = random.Random(7)
+        for _ in range(200):
+            rates = []
+            for index in range(generator.randint(1, 25)):
+                periods = [round(generator.uniform(-0.05, 0.4), 4) for _ in range(generator.randint(1, 4))]
+                schedule = None
+                if generator.random() < 0.1:
+                    # Unreadable schedules make the calculator fall back to zero energy cost
+                    schedule = generator.choice([[], [[5] * 24], [[0] * 3]])
+                rates.append(plan(index, periods, round(generator.uniform(0, 20), 2), schedule))
+            consumption = generator.choice([1000, 4321, 10000])
+            k = generator.randint(1, 5)
+
+            result = self.recommender.recommend(rates, consumption, k)
+
+            self.assertEqual(
+                [item['first_year_cost'] for item in result['recommendations']],
+                self._exhaustive(rates, consumption, k)
+            )
+            self.assertEqual(result['evaluated'] + result['pruned'], len(rates))
+
+    def test_prunes_plans_that_cannot_win(self):
+        rates = [plan(index, [0.10 + index * 0.01]) for index in range(20)]
+        result = self.recommender.recommend(rates, 6000, k=3)
+        self.assertEqual([item['label'] for item in result['recommendations']], ['L0', 'L1', 'L2'])
+        self.assertGreater(result['pruned'], 0)
+        self.assertEqual(result['default']['label'], 'L0')
@@ -0,0 +1,37 @@
+import json
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from app.middleware.profiling import ProfilingMiddleware
+
+
+class ProfilingRequestInfoTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _middleware(self):
+        return ProfilingMiddleware(lambda request: HttpResponse())
+
+    def test_bodies_are_not_stored_by_default(self):
+        request = self.factory.post('/api/utility-rates/', {'address': '1 Main St'}, content_type='application/json')
+        self.assertEqual(self._middleware()._request_info(request)['body'], '')
+
+    @override_settings(PROFILER_CAPTURE_BODIES=True)
+    def test_admin_login_form_is_never_stored(self):
+        request = self.factory.post('/admin/login/', {'username': 'admin', 'password': 'S3cret-pass!'})
+        info = self._middleware()._request_info(request)
+        self.assertEqual(info['body'], '')
+
+    @override_settings(PROFILER_CAPTURE_BODIES=True)
+    def test_api_json_bodies_are_redacted(self):
+        payload = {'address': '1 Main St', 'auth': {'password': 'S3cret-pass!', 'api_token': 'abc'}}
+        request = self.factory.post('/api/projects/?api_key=k&page=2', payload, content_type='application/json')
+        info = self._middleware()._request_info(request)
+
+        self.assertNotIn('S3cret-pass!', info['body'])
+        self.assertEqual(json.loads(info['body']), {
+            'address': '1 Main St',
+            'auth': {'password': '[redacted]', 'api_token': '[redacted]'},
+        })
+        self.assertNotIn('api_key=k', info['query'])
+        self.assertIn('page=2', info['query'])
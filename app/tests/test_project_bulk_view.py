@@ -0,0 +1,32 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from app.models import Project
+
+
+class ProjectBulkViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.payload = {'projects': [{
+            'address': '1 Main St', 'consumption': 5000, 'escalator': 4,
+            'name': 'Home', 'description': 'Roof'
+        }]}
+
+    def test_anonymous_request_is_rejected_with_json(self):
+        response = self.client.post('/api/projects/bulk/', self.payload, format='json')
+
+        self.assertIn(response.status_code, (401, 403))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('detail', response.json())
+        self.assertFalse(Project.objects.exists())
+
+    @mock.patch('app.views.project_webhook_view.ProjectWebhookHandler.notify_batch', return_value=True)
+    def test_authenticated_request_creates_projects(self, notify_batch):
+        self.client.force_authenticate(User.objects.create_user('installer'))
+        response = self.client.post('/api/projects/bulk/', self.payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created'], 1)
+        notify_batch.assert_called_once()
@@ -0,0 +1,34 @@
+import logging
+from django.test import SimpleTestCase
+
+from app.services.quote_grid import QuoteGrid
+from app.services.rate_calculator import RateCalculator
+
+
+class QuoteGridVerifyTests(SimpleTestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.calculator = RateCalculator()
+
+    def _rate(self, rate, fixed):
+        return {
+            'energyratestructure': [[{'rate': rate}]],
+            'energyweekdayschedule': [[0] * 24] * 12,
+            'fixedchargefirstmeter': fixed,
+            'fixedchargeunits': '$/month',
+        }
+
+    def test_free_plan_verifies(self):
+        rate_info = self._rate(0.0, 0)
+        report = QuoteGrid.build(rate_info, self.calculator).verify(rate_info, self.calculator, samples=20)
+
+        self.assertEqual(report['grid_mismatches'], 0)
+        self.assertEqual(report['max_interpolation_error_pct'], 0.0)
+
+    def test_priced_plan_matches_on_grid(self):
+        rate_info = self._rate(0.15, 10)
+        report = QuoteGrid.build(rate_info, self.calculator).verify(rate_info, self.calculator, samples=20)
+
+        self.assertEqual(report['grid_mismatches'], 0)
+        self.assertLess(report['max_interpolation_error_pct'], 1.0)
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from unittest import mock
+from django.test import SimpleTestCase
+
+from app.services.rate_processor import RateProcessor
+
+
+def item(label, rate=0.1):
+    return {
+        'label': label,
+        'utility': 'Utility',
+        'name': label,
+        'is_default': True,
+        'energyratestructure': [[{'rate': rate}]],
+        'energyweekdayschedule': [[0] * 24] * 12,
+        'fixedchargefirstmeter': 10,
+        'fixedchargeunits': '$/month',
+    }
+
+
+class RateProcessorMemoTests(SimpleTestCase):
+    def setUp(self):
+        # The memo is shared by every instance, so each test gets its own
+        patcher = mock.patch.object(RateProcessor, '_memo', OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.processor = RateProcessor()
+
+    def _process(self, items, item_hashes=None):
+        api_data = {'items': items}
+        if item_hashes is not None:
+            api_data['item_hashes'] = item_hashes
+        with mock.patch.object(RateProcessor, 'calculate_rate', autospec=True,
+                               side_effect=RateProcessor.calculate_rate) as calculate:
+            rates = self.processor.process_rate_data(api_data)
+        return rates, calculate.call_count
+
+    def test_hit_is_a_copy_the_caller_may_change(self):
+        first, processed = self._process([item('A')], ['h-a'])
+        self.assertEqual(processed, 1)
+        first[0]['label'] = 'changed by caller'
+        first[0]['annotation'] = True
+
+        second, processed = self._process([item('A')], ['h-a'])
+        self.assertEqual(processed, 0)
+        self.assertEqual(second[0]['label'], 'A')
+        self.assertNotIn('annotation', second[0])
+
+        second[0]['label'] = 'changed again'
+        third, _ = self._process([item('A')], ['h-a'])
+        self.assertEqual(third[0]['label'], 'A')
+
+    def test_least_recently_used_entry_is_evicted_past_memo_size(self):
+        with mock.patch.object(RateProcessor, 'MEMO_SIZE', 2):
+            self._process([item('A'), item('B')], ['h-a', 'h-b'])
+            # Touch A so B becomes the least recently used
+            self._process([item('A')], ['h-a'])
+            self._process([item('C')], ['h-c'])
+
+            self.assertEqual(list(RateProcessor._memo), ['h-a', 'h-c'])
+            _, processed = self._process([item('B')], ['h-b'])
+            self.assertEqual(processed, 1)
+
+    def test_mismatched_hashes_are_processed_directly(self):
+        rates, processed = self._process([item('A'), item('B')], ['h-a'])
+
+        self.assertEqual(processed, 2)
+        self.assertEqual({rate['label'] for rate in rates}, {'A', 'B'})
+        self.assertEqual(len(RateProcessor._memo), 0)
+
+    def test_missing_hashes_are_processed_directly(self):
+        _, processed = self._process([item('A')])
+        self.assertEqual(processed, 1)
+        _, processed = self._process([item('A')])
+        self.assertEqual(processed, 1)
+        self.assertEqual(len(RateProcessor._memo), 0)
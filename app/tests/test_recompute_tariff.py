@@ -0,0 +1,32 @@
+import logging
+from django.test import SimpleTestCase
+
+from app.management.commands.recompute_tariff import Command
+from app.models import Tariff
+
+
+class RecomputeCheckpointTests(SimpleTestCase):
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.command = Command()
+        self.tariff = Tariff(pk=1, label='plan-a')
+        self.rate_info = {
+            'energyratestructure': [[{'rate': 0.12}], [{'rate': 0.2}]],
+            'energyweekdayschedule': [[0] * 12 + [1] * 12] * 12,
+            'fixedchargefirstmeter': 10,
+            'fixedchargeunits': '$/month',
+            'avg_rate': 15.0,
+        }
+
+    def _key(self, **changes):
+        rate_info = {**self.rate_info, **changes}
+        return self.command._revision_key(rate_info, self.tariff, rate_info['avg_rate'])
+
+    def test_key_covers_every_calculator_input(self):
+        key = self._key()
+        self.assertEqual(key, self._key())
+        self.assertNotEqual(key, self._key(energyweekdayschedule=[[1] * 12 + [0] * 12] * 12))
+        self.assertNotEqual(key, self._key(fixedchargefirstmeter=12))
+        self.assertNotEqual(key, self._key(fixedchargeunits='$/day'))
+        self.assertNotEqual(key, self._key(avg_rate=16.0))
@@ -0,0 +1,107 @@
+import os
+import tempfile
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.models import UtilityCell
+from app.services import location_resolver
+from app.services.location_resolver import LocationResolver, OfflineGeocodingBackend
+from app.services.resolving_rate_provider import ResolvingRateProvider
+from app.services.tariff_refresh import TariffRefreshScheduler
+
+
+def tariff(eiaid, label):
+    return {'label': label, 'eiaid': eiaid, 'utility': f"Utility {eiaid}", 'name': label, 'is_default': True}
+
+
+class FakeOpenEI:
+    """Serves tariffs by street so two addresses in one ZIP can have different utilities"""
+
+    def __init__(self, utilities_by_street):
+        self.utilities_by_street = utilities_by_street
+        self.calls = []
+
+    def _utility_ids(self, address):
+        return next(ids for street, ids in self.utilities_by_street.items() if street in address)
+
+    def get_utility_rates(self, address):
+        self.calls.append(('address', address))
+        return {'items': [tariff(eiaid, f"L{eiaid}") for eiaid in self._utility_ids(address)]}
+
+    def get_utility_ids(self, address):
+        self.calls.append(('confirm', address))
+        return sorted(self._utility_ids(address))
+
+    def get_utility_rates_by_utility(self, utility_id):
+        self.calls.append(('utility', utility_id))
+        return {'items': [tariff(utility_id, f"L{utility_id}")]}
+
+
+class ResolvingRateProviderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _provider(self, openei):
+        # No centroid file, so cells are whole ZIP codes
+        return ResolvingRateProvider(
+            openei,
+            LocationResolver(OfflineGeocodingBackend()),
+            scheduler=TariffRefreshScheduler()
+        )
+
+    def _eiaids(self, data):
+        return {item['eiaid'] for item in data['items']}
+
+    def test_zip_served_by_two_utilities_quotes_each_address_its_own(self):
+        openei = FakeOpenEI({'Main St': [1], 'Oak Ave': [2]})
+        provider = self._provider(openei)
+
+        self.assertEqual(self._eiaids(provider.get_utility_rates('1 Main St, Springfield, IL 62701')), {1})
+        self.assertEqual(self._eiaids(provider.get_utility_rates('9 Oak Ave, Springfield, IL 62701')), {2})
+        self.assertIn(('confirm', '9 Oak Ave, Springfield, IL 62701'), openei.calls)
+        self.assertEqual(UtilityCell.objects.get(cell='zip:62701').utility_ids, [1, 2])
+
+        # The first address still gets only its own utility once the cell knows both
+        self.assertEqual(self._eiaids(provider.get_utility_rates('1 Main St, Springfield, IL 62701')), {1})
+
+    def test_single_utility_zip_serves_tariffs_from_the_utility_cache(self):
+        openei = FakeOpenEI({'Main St': [1], 'Oak Ave': [1]})
+        provider = self._provider(openei)
+
+        provider.get_utility_rates('1 Main St, Springfield, IL 62701')
+        data = provider.get_utility_rates('9 Oak Ave, Springfield, IL 62701')
+
+        self.assertEqual(self._eiaids(data), {1})
+        # One full fetch seeds the cache; the second address only confirms its utility
+        self.assertEqual(openei.calls, [
+            ('address', '1 Main St, Springfield, IL 62701'),
+            ('confirm', '9 Oak Ave, Springfield, IL 62701'),
+        ])
+
+        provider.get_utility_rates('9 Oak Ave, Springfield, IL 62701')
+        self.assertEqual(len(openei.calls), 2)
+
+        # The full fetch already confirmed the first address's utilities
+        provider.get_utility_rates('1 Main St, Springfield, IL 62701')
+        self.assertEqual(len(openei.calls), 2)
+
+
+class SharedResolverTests(TestCase):
+    def test_views_share_one_resolver_per_process(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as centroids:
+            centroids.write('zip,latitude,longitude\n62701,39.80,-89.64\n')
+        self.addCleanup(os.remove, centroids.name)
+        cache.clear()
+        self.addCleanup(lambda: setattr(location_resolver, '_resolver', None))
+        location_resolver._resolver = None
+
+        with override_settings(GEOCODING_BACKEND='offline', ZIP_CENTROIDS_PATH=centroids.name), \
+                mock.patch.object(OfflineGeocodingBackend, '__init__', autospec=True,
+                                  side_effect=OfflineGeocodingBackend.__init__) as load:
+            first = ResolvingRateProvider.from_settings()
+            second = ResolvingRateProvider.from_settings()
+
+        self.assertIs(first.resolver, second.resolver)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first.resolver.resolve('1 Main St, Springfield, IL 62701').cell, 'geo:39.8,-89.6')
@@ -0,0 +1,165 @@
+import heapq
+import threading
+import time
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from app.services.location_resolver import LocationResolver, OfflineGeocodingBackend
+from app.services.resolving_rate_provider import ResolvingRateProvider
+from app.services.tariff_refresh import TariffRefreshScheduler
+
+ADDRESS = '1 Main St, Springfield, IL 62701'
+UTILITY_KEY = f"{ResolvingRateProvider.UTILITY_CACHE_PREFIX}1"
+
+
+class ManualScheduler(TariffRefreshScheduler):
+    """Queues refreshes like the real scheduler but runs them only when asked"""
+
+    def _ensure_running(self):
+        pass
+
+    def run_pending(self):
+        outcomes = []
+        while self._queue:
+            _, _, key = heapq.heappop(self._queue)
+            outcomes.append(self._pending.pop(key)())
+        return outcomes
+
+
+class FakeOpenEI:
+    """One utility whose tariffs the test can revise between fetches"""
+
+    def __init__(self):
+        self.tariffs = {'A': 0.1, 'B': 0.2}
+        self.calls = 0
+
+    def _items(self):
+        return [
+            {'label': label, 'eiaid': 1, 'utility': 'Utility 1', 'name': label,
+             'energyratestructure': [[{'rate': rate}]]}
+            for label, rate in self.tariffs.items()
+        ]
+
+    def get_utility_rates(self, address):
+        self.calls += 1
+        return {'items': self._items()}
+
+    def get_utility_ids(self, address):
+        self.calls += 1
+        return [1]
+
+    def get_utility_rates_by_utility(self, utility_id):
+        self.calls += 1
+        return {'items': self._items()}
+
+
+class StaleWhileRevalidateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.openei = FakeOpenEI()
+        self.scheduler = ManualScheduler(hot_threshold=3)
+        self.fetched = []
+        self.provider = ResolvingRateProvider(
+            self.openei,
+            LocationResolver(OfflineGeocodingBackend()),
+            cache_ttl=60,
+            on_items_fetched=self.fetched.extend,
+            scheduler=self.scheduler
+        )
+        # The full fetch seeds the per-utility entry that later quotes read
+        self.provider.get_utility_rates(ADDRESS)
+        self.fetched.clear()
+        self.openei.calls = 0
+
+    def _age(self, seconds):
+        entry = cache.get(UTILITY_KEY)
+        entry['fetched_at'] -= seconds
+        cache.set(UTILITY_KEY, entry)
+
+    def _rates(self):
+        return {item['label']: item['energyratestructure'][0][0]['rate']
+                for item in self.provider.get_utility_rates(ADDRESS)['items']}
+
+    def test_stale_entry_is_served_then_only_changed_tariffs_are_passed_on(self):
+        self._age(61)
+        self.openei.tariffs['B'] = 0.25
+
+        self.assertEqual(self._rates(), {'A': 0.1, 'B': 0.2})
+        self.assertEqual(self.openei.calls, 0)
+
+        self.assertEqual(self.scheduler.run_pending(), ['changed'])
+        self.assertEqual([item['label'] for item in self.fetched], ['B'])
+        self.assertEqual(self._rates(), {'A': 0.1, 'B': 0.25})
+
+    def test_unchanged_refresh_passes_nothing_on(self):
+        self._age(61)
+        self._rates()
+
+        self.assertEqual(self.scheduler.run_pending(), ['unchanged'])
+        self.assertEqual(self.fetched, [])
+
+    def test_duplicate_refreshes_are_queued_once(self):
+        self._age(61)
+        self._rates()
+        self._rates()
+
+        self.assertEqual(len(self.scheduler._queue), 1)
+        self.scheduler.run_pending()
+        self.assertEqual(self.openei.calls, 1)
+
+    def test_hot_entries_are_refreshed_ahead_of_expiry(self):
+        # Past the refresh-ahead point but not yet stale
+        self._age(60 * self.provider.refresh_ahead + 1)
+
+        self._rates()
+        self.assertEqual(self.scheduler._queue, [])
+
+        self._rates()
+        self._rates()
+        self.assertEqual([key for _, _, key in self.scheduler._queue], [UTILITY_KEY])
+
+    def test_fresh_entries_are_not_refreshed(self):
+        for _ in range(5):
+            self._rates()
+        self.assertEqual(self.scheduler._queue, [])
+
+
+class TariffRefreshSchedulerTests(SimpleTestCase):
+    def test_key_is_not_queued_again_until_its_refresh_finishes(self):
+        scheduler = TariffRefreshScheduler(budget_per_minute=6000)
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def job():
+            started.set()
+            release.wait(5)
+            finished.set()
+            return 'unchanged'
+
+        self.assertTrue(scheduler.request('key', job))
+        self.assertTrue(started.wait(5))
+        self.assertFalse(scheduler.request('key', job))
+
+        release.set()
+        self.assertTrue(finished.wait(5))
+        # The key is released just after the job returns
+        for _ in range(100):
+            if scheduler.request('key', lambda: 'unchanged'):
+                break
+            time.sleep(0.01)
+        else:
+            self.fail("Key was never released after its refresh finished")
+
+    def test_popular_keys_are_refreshed_first(self):
+        scheduler = ManualScheduler()
+        order = []
+        for _ in range(3):
+            scheduler.record_access('popular')
+        scheduler.record_access('rare')
+
+        scheduler.request('rare', lambda: order.append('rare') or 'unchanged')
+        scheduler.request('popular', lambda: order.append('popular') or 'unchanged')
+        scheduler.run_pending()
+
+        self.assertEqual(order, ['popular', 'rare'])
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from django.test import SimpleTestCase, TestCase
+
+from app.management.commands.backcast_proposals import Command as BackcastCommand
+from app.models import TariffVersion
+from app.repositories.tariff_version_repository import TariffVersionRepository
+from app.services.rate_processor import RateProcessor
+
+JAN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+JUL = datetime(2024, 7, 1, tzinfo=timezone.utc)
+OCT = datetime(2024, 10, 1, tzinfo=timezone.utc)
+DEC = datetime(2024, 12, 1, tzinfo=timezone.utc)
+SECOND = timedelta(seconds=1)
+
+
+def item(label, start, end=None, eiaid=1, name=None, is_default=True):
+    raw = {
+        'label': label,
+        'eiaid': eiaid,
+        'utility': 'Utility',
+        'name': name or label,
+        'is_default': is_default,
+        'startdate': int(start.timestamp()),
+        'energyratestructure': [[{'rate': 0.1}]],
+        'energyweekdayschedule': [[0] * 24] * 12,
+        'fixedchargefirstmeter': 10,
+        'fixedchargeunits': '$/month',
+    }
+    if end:
+        raw['enddate'] = int(end.timestamp())
+    return raw
+
+
+class ProcessAsOfTests(SimpleTestCase):
+    def _labels(self, items, as_of):
+        return [rate['label'] for rate in RateProcessor().process_rate_data({'items': items}, as_of)]
+
+    def test_only_items_in_effect_on_as_of_are_kept(self):
+        items = [
+            item('ended-on-date', JAN, JUL),
+            item('ends-after', JAN, OCT),
+            item('starts-on-date', JUL),
+            item('starts-after', JUL + SECOND),
+            item('open-ended', JAN),
+        ]
+
+        self.assertEqual(
+            sorted(self._labels(items, JUL)),
+            ['ends-after', 'open-ended', 'starts-on-date']
+        )
+
+    def test_revision_in_effect_a_second_earlier(self):
+        items = [item('old', JAN, JUL), item('new', JUL)]
+
+        self.assertEqual(self._labels(items, JUL - SECOND), ['old'])
+        self.assertEqual(self._labels(items, JUL), ['new'])
+
+
+class TariffVersionRepositoryTests(TestCase):
+    def setUp(self):
+        TariffVersionRepository.index([item('plan', JAN, JUL, name='First'), item('plan', JUL, name='Second')])
+
+    def test_index_upserts_on_label_and_startdate(self):
+        written = TariffVersionRepository.index([
+            item('plan', JUL, OCT, name='Second revised'),
+            {'name': 'No label'},
+        ])
+
+        self.assertEqual(written, 1)
+        self.assertEqual(TariffVersion.objects.filter(label='plan').count(), 2)
+        revised = TariffVersion.objects.get(label='plan', startdate=JUL)
+        self.assertEqual(revised.name, 'Second revised')
+        self.assertEqual(revised.enddate, OCT)
+        self.assertEqual(revised.item['name'], 'Second revised')
+
+    def test_version_of_at_interval_edges(self):
+        self.assertIsNone(TariffVersionRepository.version_of('plan', JAN - SECOND))
+        self.assertEqual(TariffVersionRepository.version_of('plan', JAN)['name'], 'First')
+        self.assertEqual(TariffVersionRepository.version_of('plan', JUL - SECOND)['name'], 'First')
+        self.assertEqual(TariffVersionRepository.version_of('plan', JUL)['name'], 'Second')
+        self.assertIsNone(TariffVersionRepository.version_of('other', JUL))
+
+    def test_as_of_swaps_in_the_revisions_then_in_effect(self):
+        TariffVersionRepository.index([item('other-utility', JAN, eiaid=2)])
+        current = {'items': [item('plan', JUL, name='Second')]}
+
+        self.assertEqual([raw['name'] for raw in TariffVersionRepository.as_of(current, JUL - SECOND)['items']], ['First'])
+        self.assertEqual([raw['name'] for raw in TariffVersionRepository.as_of(current, JUL)['items']], ['Second'])
+        self.assertEqual(TariffVersionRepository.as_of(current, JAN - SECOND)['items'], [])
+
+
+class BackcastVersionLookupTests(TestCase):
+    def setUp(self):
+        # A gap between the revisions, and the last one has ended
+        TariffVersionRepository.index([
+            item('plan', JAN, JUL, name='First'),
+            item('plan', OCT, DEC, name='Second'),
+        ])
+        self.command = BackcastCommand()
+        self.command.versions = {}
+
+    def _name(self, effective_at):
+        version = self.command._version_of('plan', effective_at)
+        return version.name if version else None
+
+    def test_bisect_picks_the_revision_in_effect(self):
+        self.assertIsNone(self._name(JAN - SECOND))
+        self.assertEqual(self._name(JAN), 'First')
+        self.assertEqual(self._name(JUL - SECOND), 'First')
+        self.assertIsNone(self._name(JUL))
+        self.assertEqual(self._name(OCT), 'Second')
+        self.assertEqual(self._name(DEC - SECOND), 'Second')
+
+    def test_ended_revision_is_not_used(self):
+        self.assertIsNone(self._name(DEC))
+        self.assertIsNone(self._name(DEC + timedelta(days=365)))
+
+    def test_unknown_label_has_no_version(self):
+        self.assertIsNone(self.command._version_of('missing', JUL))
@@ -1,8 +1,17 @@
 from django.urls import path
-from app.views import HomeView, UtilityRateView, ProjectAPIView
+from app.views import (
+    HomeView, UtilityRateView, RateRecommendationView, ProjectAPIView, ProjectBulkAPIView,
+    AnalyticsView, MetricsView, ProfileListView, ProfileDownloadView
+)
 
 urlpatterns = [
     path('', HomeView.as_view(), name='home'),
     path('api/utility-rates/', UtilityRateView.as_view(), name='utility-rates'),
+    path('api/utility-rates/recommendations/', RateRecommendationView.as_view(), name='rate-recommendations'),
     path('api/projects/', ProjectAPIView.as_view(), name='project-webhook'),
+    path('api/projects/bulk/', ProjectBulkAPIView.as_view(), name='project-bulk'),
+    path('api/analytics/', AnalyticsView.as_view(), name='analytics'),
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
+    path('api/profiles/', ProfileListView.as_view(), name='profiles'),
+    path('api/profiles/<str:capture_id>/', ProfileDownloadView.as_view(), name='profile-download'),
 ]
@@ -1,5 +1,19 @@
 from .home_view import HomeView
 from .utility_rate_view import UtilityRateView
-from .project_webhook_view import ProjectAPIView
+from .project_webhook_view import ProjectAPIView, ProjectBulkAPIView
+from .analytics_view import AnalyticsView
+from .metrics_view import MetricsView
+from .profile_view import ProfileListView, ProfileDownloadView
+from .rate_recommendation_view import RateRecommendationView
 
-__all__ = ['HomeView', 'UtilityRateView', 'ProjectAPIView']
+__all__ = [
+    'HomeView',
+    'UtilityRateView',
+    'RateRecommendationView',
+    'ProjectAPIView',
+    'ProjectBulkAPIView',
+    'AnalyticsView',
+    'MetricsView',
+    'ProfileListView',
+    'ProfileDownloadView',
+]
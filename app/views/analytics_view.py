@@ -0,0 +1,32 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+
+from app.models import RateAnalytics
+from app.repositories.analytics_repository import AnalyticsRepository
+
+class AnalyticsView(APIView):
+    """Dashboard reads served from the incrementally maintained totals"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        dimension = request.query_params.get('dimension', RateAnalytics.DIMENSION_PLAN)
+        key = request.query_params.get('key')
+
+        if dimension not in dict(RateAnalytics.DIMENSION_CHOICES):
+            return Response(
+                {'error': f"Unknown dimension: {dimension}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if key is None:
+            return Response({'results': AnalyticsRepository.list_summaries(dimension)})
+
+        summary = AnalyticsRepository.get_summary(dimension, key)
+        if summary is None:
+            return Response(
+                {'error': f"No analytics for {dimension} {key}"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(summary)
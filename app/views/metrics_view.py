@@ -0,0 +1,26 @@
+import hmac
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from app.metrics import registry
+
+class MetricsView(View):
+    """Exposes the process metrics in the Prometheus text format to staff and the configured scraper"""
+
+    def get(self, request):
+        if not self._allowed(request):
+            return HttpResponseForbidden('Metrics are restricted')
+        return HttpResponse(
+            registry.render(),
+            content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
+
+    @staticmethod
+    def _allowed(request) -> bool:
+        user = getattr(request, 'user', None)
+        if user and user.is_staff:
+            return True
+        token = settings.METRICS_TOKEN
+        header = request.headers.get('Authorization', '')
+        return bool(token) and hmac.compare_digest(header.encode('utf-8'), f"Bearer {token}".encode('utf-8'))
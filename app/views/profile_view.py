@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.http import FileResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework import status
+
+from app.profiling import ProfileStore
+
+def get_profile_store() -> ProfileStore:
+    return ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_CAPTURES)
+
+class ProfileListView(APIView):
+    """Lists stored request profiles, slowest first"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({'profiles': get_profile_store().list()})
+
+class ProfileDownloadView(APIView):
+    """Downloads a stored request profile"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, capture_id):
+        store = get_profile_store()
+        meta = store.get(capture_id)
+        if meta is None or not store.path_for(meta).exists():
+            return Response(
+                {'error': 'Profile not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return FileResponse(
+            open(store.path_for(meta), 'rb'),
+            as_attachment=True,
+            filename=meta['filename']
+        )
@@ -3,14 +3,21 @@ import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 from django.conf import settings
 from django.db import transaction
 from django.core.exceptions import ValidationError
 
 from app.models import Project
+from app.metrics import registry, span
 
 logger = logging.getLogger(__name__)
 
+webhook_deliveries = registry.counter(
+    'solarate_webhook_deliveries_total',
+    'Webhook delivery attempts by outcome'
+)
+
 class ProjectWebhookHandler:
     """Handles webhook notifications for project events"""
 
@@ -27,23 +34,42 @@ class ProjectWebhookHandler:
             event_type (str): Type of event (e.g., 'project.created')
             project_data (dict): Project data to send in webhook
         """
-        try:
-            payload = {
-                'event': event_type,
-                'project': project_data
-            }
+        payload = {
+            'event': event_type,
+            'project': project_data
+        }
+        logger.info(f"Sending webhook to {self.webhook_url} with payload: {payload}")
+        return self._send(payload)
 
-            logger.info(f"Sending webhook to {self.webhook_url} with payload: {payload}")
+    def notify_batch(self, event_type, projects_data):
+        """
+        Send one webhook notification covering several projects
 
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
-            )
+        Args:
+            event_type (str): Type of event (e.g., 'project.created')
+            projects_data (list): Project data for each project in the batch
+        """
+        payload = {
+            'event': event_type,
+            'projects': projects_data
+        }
+        logger.info(f"Sending webhook to {self.webhook_url} for {len(projects_data)} projects")
+        return self._send(payload)
+
+    def _send(self, payload):
+        """POST a payload to the webhook URL, returns whether it was accepted"""
+        try:
+            with span('webhook'):
+                response = requests.post(
+                    self.webhook_url,
+                    json=payload,
+                    headers={'Content-Type': 'application/json'}
+                )
 
             logger.info(f"Webhook response status: {response.status_code}")
             logger.info(f"Webhook response content: {response.text}")
 
+            webhook_deliveries.inc(outcome='delivered' if response.ok else 'failed')
             if not response.ok:
                 logger.error(
                     f"Webhook delivery failed: {response.status_code} - {response.text}"
@@ -52,9 +78,22 @@ class ProjectWebhookHandler:
             return response.ok
 
         except Exception as e:
+            webhook_deliveries.inc(outcome='error')
             logger.error(f"Error sending webhook: {str(e)}", exc_info=True)
             return False
 
+REQUIRED_PROJECT_FIELDS = ['address', 'consumption', 'name', 'percentage']
+
+def extract_project_data(data):
+    """Project fields from a request payload, raises ValueError on non-numeric values"""
+    return {
+        'address': data.get('address'),
+        'consumption': float(data.get('consumption', 0)),
+        'percentage': float(data.get('escalator', 4)),
+        'name': data.get('name'),
+        'description': data.get('description'),
+    }
+
 class ProjectAPIView(APIView):
     """API endpoint for project operations"""
 
@@ -67,17 +106,10 @@ class ProjectAPIView(APIView):
         try:
             with transaction.atomic():
                 # Extract and validate project data from the request
-                project_data = {
-                    'address': request.data.get('address'),
-                    'consumption': float(request.data.get('consumption', 0)),
-                    'percentage': float(request.data.get('escalator', 4)),
-                    'name': request.data.get('name'),
-                    'description': request.data.get('description'),
-                }
+                project_data = extract_project_data(request.data)
 
                 # Validate required fields
-                required_fields = ['address', 'consumption', 'name', 'percentage']
-                missing_fields = [field for field in required_fields if not project_data.get(field)]
+                missing_fields = [field for field in REQUIRED_PROJECT_FIELDS if not project_data.get(field)]
 
                 if missing_fields:
                     return Response(
@@ -86,10 +118,11 @@ class ProjectAPIView(APIView):
                     )
 
                 # Create the project record
-                project = Project.objects.create(
-                    user=request.user,
-                    **project_data
-                )
+                with span('db'):
+                    project = Project.objects.create(
+                        user=request.user,
+                        **project_data
+                    )
 
                 # Send webhook notification
                 webhook_success = self.webhook_handler.notify(
@@ -123,3 +156,109 @@ class ProjectAPIView(APIView):
                 {'error': 'An error occurred while creating the project'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+class ProjectBulkAPIView(APIView):
+    """API endpoint for creating many projects in one request"""
+    # Projects belong to a user, so anonymous requests are turned away before validation
+    permission_classes = [IsAuthenticated]
+    MAX_PROJECTS = 5000
+    CHUNK_SIZE = 500
+
+    def __init__(self):
+        super().__init__()
+        self.webhook_handler = ProjectWebhookHandler()
+
+    def post(self, request):
+        """
+        Handle POST requests carrying a list of projects
+        Valid projects are inserted a chunk per transaction, each chunk
+        followed by one batched webhook; every item gets its own result
+        """
+        projects = request.data.get('projects') if isinstance(request.data, dict) else request.data
+        if not isinstance(projects, list) or not projects:
+            return Response(
+                {'error': 'Expected a non-empty list of projects'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(projects) > self.MAX_PROJECTS:
+            return Response(
+                {'error': f"At most {self.MAX_PROJECTS} projects can be created per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = [None] * len(projects)
+        valid = []
+        for index, item in enumerate(projects):
+            project_data, error = self._validate(request.user, item)
+            if error:
+                results[index] = {'index': index, 'status': 'invalid', **error}
+            else:
+                valid.append((index, project_data))
+
+        for start in range(0, len(valid), self.CHUNK_SIZE):
+            self._create_chunk(request.user, valid[start:start + self.CHUNK_SIZE], results)
+
+        created = sum(1 for result in results if result['status'] == 'created')
+        if created == len(projects):
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response({
+            'created': created,
+            'failed': len(projects) - created,
+            'results': results
+        }, status=response_status)
+
+    def _validate(self, user, item):
+        """Return (project_data, None) for a valid item, or (None, error details)"""
+        if not isinstance(item, dict):
+            return None, {'error': 'Each project must be an object'}
+        try:
+            project_data = extract_project_data(item)
+        except (TypeError, ValueError):
+            return None, {'error': 'Consumption and escalator must be numbers'}
+
+        missing_fields = [field for field in REQUIRED_PROJECT_FIELDS if not project_data.get(field)]
+        if missing_fields:
+            return None, {'error': f"Missing required fields: {', '.join(missing_fields)}"}
+
+        # bulk_create skips model validation, and one bad row would fail its whole chunk
+        try:
+            Project(user=user, **project_data).full_clean(exclude=['user', 'selected_rate'])
+        except ValidationError as e:
+            return None, {'error': 'Invalid data', 'details': e.message_dict}
+        return project_data, None
+
+    def _create_chunk(self, user, chunk, results):
+        """Insert one chunk atomically, then notify the webhook once for it"""
+        try:
+            with transaction.atomic(), span('db'):
+                projects = Project.objects.bulk_create(
+                    [Project(user=user, **project_data) for _, project_data in chunk]
+                )
+        except Exception as e:
+            logger.error(f"Error creating project chunk: {str(e)}", exc_info=True)
+            for index, _ in chunk:
+                results[index] = {'index': index, 'status': 'failed', 'error': 'Could not save project'}
+            return
+
+        webhook_success = self.webhook_handler.notify_batch(
+            'project.created',
+            [
+                {'id': project.id, 'user_id': user.id, **project_data}
+                for project, (_, project_data) in zip(projects, chunk)
+            ]
+        )
+        if not webhook_success:
+            logger.warning(f"Webhook delivery failed for {len(projects)} bulk-created projects")
+
+        for project, (index, _) in zip(projects, chunk):
+            results[index] = {
+                'index': index,
+                'status': 'created',
+                'id': project.id,
+                'webhook_delivered': webhook_success
+            }
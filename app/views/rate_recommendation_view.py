@@ -0,0 +1,97 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from ..services.openei_quota import QuotaExceeded
+from ..services.resolving_rate_provider import ResolvingRateProvider
+from ..services.rate_processor import RateProcessor
+from ..services.plan_recommender import PlanRecommender
+from ..services.input_validator import InputValidator
+from ..repositories.tariff_version_repository import TariffVersionRepository
+from ..metrics import span
+
+logger = logging.getLogger(__name__)
+
+MAX_RECOMMENDATIONS = 10
+
+class RateRecommendationView(APIView):
+    """
+    API View returning the cheapest rate plans for an address and usage
+    """
+    def __init__(self):
+        super().__init__()
+        self.rate_provider = ResolvingRateProvider.from_settings(
+            on_items_fetched=TariffVersionRepository.index
+        )
+        self.rate_processor = RateProcessor()
+        self.recommender = PlanRecommender()
+        self.validator = InputValidator()
+
+    def post(self, request):
+        """
+        Handle POST requests for plan recommendations
+        Only plans whose lower bound can still make the top k are fully costed
+        """
+        address = request.data.get('address')
+        as_of = request.data.get('as_of')
+        try:
+            yearly_consumption = float(request.data.get('consumption', 0))
+            escalator = float(request.data.get('escalator', 4))
+            k = int(request.data.get('k', 3))
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Consumption, escalator and k must be numbers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            validation_error = self.validator.validate_input(
+                address, yearly_consumption, escalator
+            ) or self.validator.validate_as_of(as_of)
+            if validation_error:
+                return Response(
+                    validation_error,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not 1 <= k <= MAX_RECOMMENDATIONS:
+                return Response(
+                    {'error': f'k must be between 1 and {MAX_RECOMMENDATIONS}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            with span('openei'):
+                raw_rates = self.rate_provider.get_utility_rates(address)
+            as_of = self.validator.parse_as_of(as_of)
+            if as_of:
+                with span('db'):
+                    raw_rates = TariffVersionRepository.as_of(raw_rates, as_of)
+            with span('process'):
+                rates = self.rate_processor.process_rate_data(raw_rates, as_of)
+
+            if not rates:
+                return Response(
+                    {'error': 'No utility rates found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            with span('recommend'):
+                result = self.recommender.recommend(rates, yearly_consumption, k)
+
+            return Response(result)
+
+        except QuotaExceeded as e:
+            logger.warning(f"Rejected quote while OpenEI quota is exhausted: {str(e)}")
+            return Response(
+                {'error': 'Utility rate lookups are temporarily rate limited, please retry shortly'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(int(e.retry_after) + 1)}
+            )
+        except Exception as e:
+            logger.error(
+                f"Error processing request: {str(e)}",
+                exc_info=True
+            )
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -4,11 +4,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
-from ..services.rate_provider import OpenEIRateProvider
+from ..services.openei_quota import QuotaExceeded
+from ..services.resolving_rate_provider import ResolvingRateProvider
 from ..services.rate_processor import RateProcessor
 from ..services.rate_calculator import RateCalculator
+from ..services.quote_grid import QuoteGridStore
 from ..services.input_validator import InputValidator
 from ..repositories.project_repository import ProjectRepository
+from ..repositories.tariff_version_repository import TariffVersionRepository
+from ..metrics import span
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +22,12 @@ class UtilityRateView(APIView):
     """
     def __init__(self):
         super().__init__()
-        self.rate_provider = OpenEIRateProvider(settings.OPENEI_API_KEY)
         self.rate_processor = RateProcessor()
         self.rate_calculator = RateCalculator()
+        self.quote_grids = QuoteGridStore(self.rate_calculator)
+        self.rate_provider = ResolvingRateProvider.from_settings(
+            on_items_fetched=self._on_items_fetched
+        )
         self.validator = InputValidator()
         self.project_repository = ProjectRepository()
 
@@ -36,11 +43,12 @@ class UtilityRateView(APIView):
             daily_consumption = yearly_consumption / 365
             escalator = float(request.data.get('escalator', 4))
             selected_rate = request.data.get('selected_rate')
+            as_of = request.data.get('as_of')
 
             # Validate input
             validation_error = self.validator.validate_input(
                 address, yearly_consumption, escalator
-            )
+            ) or self.validator.validate_as_of(as_of)
             if validation_error:
                 return Response(
                     validation_error,
@@ -48,8 +56,14 @@ class UtilityRateView(APIView):
                 )
 
             # Fetch and process rates
-            raw_rates = self.rate_provider.get_utility_rates(address)
-            rates = self.rate_processor.process_rate_data(raw_rates)
+            with span('openei'):
+                raw_rates = self.rate_provider.get_utility_rates(address)
+            as_of = self.validator.parse_as_of(as_of)
+            if as_of:
+                with span('db'):
+                    raw_rates = TariffVersionRepository.as_of(raw_rates, as_of)
+            with span('process'):
+                rates = self.rate_processor.process_rate_data(raw_rates, as_of)
 
             if not rates:
                 return Response(
@@ -67,42 +81,31 @@ class UtilityRateView(APIView):
                 most_likely_rate
             ) if selected_rate else most_likely_rate
 
-            # Calculate costs using enhanced calculator
-            yearly_costs = self.rate_calculator.calculate_yearly_cost(
-                current_rate,
-                yearly_consumption,
-                escalator
-            )
-
-            # Calculate average rate using load curve
-            effective_rate = self.rate_calculator.calculate_average_rate(
-                current_rate['energyratestructure'],
-                current_rate['energyweekdayschedule'],
-                daily_consumption
-            )
-
-            # Calculate daily cost breakdown
-            daily_cost = self.rate_calculator.calculate_daily_cost(
-                current_rate['energyratestructure'],
-                current_rate['energyweekdayschedule'],
-                daily_consumption
-            )
+            with span('calculate'):
+                yearly_costs, effective_rate, daily_cost = self._quote(
+                    current_rate,
+                    yearly_consumption,
+                    escalator
+                )
 
             # Add rate information to each rate option
-            rates_with_analysis = self._add_rate_analysis(
-                rates,
-                daily_consumption
-            )
+            with span('analysis'):
+                rates_with_analysis = self._add_rate_analysis(
+                    rates,
+                    daily_consumption
+                )
 
-            # Save project with enhanced details
-            self.project_repository.save_project(
-                request.user,
-                address,
-                yearly_consumption,
-                escalator,
-                current_rate,
-                yearly_costs[0]
-            )
+            # Save project with enhanced details, historical quotes are not proposals
+            if as_of is None:
+                with span('db'):
+                    self.project_repository.save_project(
+                        request.user,
+                        address,
+                        yearly_consumption,
+                        escalator,
+                        current_rate,
+                        yearly_costs[0]
+                    )
 
             return Response({
                 'rates': rates_with_analysis,
@@ -115,6 +118,13 @@ class UtilityRateView(APIView):
                 'load_curve': self.rate_calculator.load_curve
             })
 
+        except QuotaExceeded as e:
+            logger.warning(f"Rejected quote while OpenEI quota is exhausted: {str(e)}")
+            return Response(
+                {'error': 'Utility rate lookups are temporarily rate limited, please retry shortly'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(int(e.retry_after) + 1)}
+            )
         except Exception as e:
             logger.error(
                 f"Error processing request: {str(e)}",
@@ -125,6 +135,55 @@ class UtilityRateView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _quote(self, rate: Dict, yearly_consumption: float, escalator: float):
+        """
+        Return yearly costs, effective rate and daily cost for a plan,
+        from its precomputed quote grid when one covers the inputs
+        """
+        grid = self.quote_grids.get(rate)
+        if grid is None:
+            self.quote_grids.schedule([rate])
+        else:
+            quote = grid.lookup(
+                yearly_consumption,
+                escalator,
+                interpolate=settings.QUOTE_GRID_INTERPOLATE
+            )
+            if quote:
+                return quote['yearly_costs'], quote['effective_rate'], quote['daily_cost']
+
+        daily_consumption = yearly_consumption / 365
+
+        # Calculate costs using enhanced calculator
+        yearly_costs = self.rate_calculator.calculate_yearly_cost(
+            rate,
+            yearly_consumption,
+            escalator
+        )
+
+        # Calculate average rate using load curve
+        effective_rate = self.rate_calculator.calculate_average_rate(
+            rate['energyratestructure'],
+            rate['energyweekdayschedule'],
+            daily_consumption
+        )
+
+        # Calculate daily cost breakdown
+        daily_cost = self.rate_calculator.calculate_daily_cost(
+            rate['energyratestructure'],
+            rate['energyweekdayschedule'],
+            daily_consumption
+        )
+        return yearly_costs, effective_rate, daily_cost
+
+    def _on_items_fetched(self, items: List[Dict]):
+        """
+        Record new tariff revisions and queue quote grids for the ones
+        in effect now
+        """
+        TariffVersionRepository.index(items)
+        self.quote_grids.schedule(self.rate_processor.process_rate_data({'items': items}))
+
     def _add_rate_analysis(
         self,
         rates: List[Dict],
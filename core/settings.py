@@ -32,6 +32,8 @@ ALLOWED_HOSTS = []
 
 # OpenEI API settings
 OPENEI_API_KEY= os.getenv('OPENEI_API_KEY')
+# Point at a local stub (see `manage.py openei_stub`) for offline load testing
+OPENEI_BASE_URL = os.getenv('OPENEI_BASE_URL', 'https://api.openei.org/utility_rates')
 
 # Webhook settings
 WEBHOOK_URL = os.getenv('WEBHOOK_URL')
@@ -39,6 +41,41 @@ WEBHOOK_URL = os.getenv('WEBHOOK_URL')
 if not WEBHOOK_URL:
     raise ValueError("WEBHOOK_URL environment variable is not set")
 
+# Address resolution settings ('offline' uses ZIP centroids, 'nominatim' calls OpenStreetMap)
+GEOCODING_BACKEND = os.getenv('GEOCODING_BACKEND', 'offline')
+GEOCODING_USER_AGENT = os.getenv('GEOCODING_USER_AGENT', 'solarate')
+ZIP_CENTROIDS_PATH = os.getenv('ZIP_CENTROIDS_PATH')
+# Decimal places kept when rounding coordinates into a geocell (1 is roughly 11 km)
+GEOCELL_PRECISION = int(os.getenv('GEOCELL_PRECISION', '1'))
+# Seconds an OpenEI response stays fresh in the shared tariff cache
+OPENEI_CACHE_TTL = int(os.getenv('OPENEI_CACHE_TTL', str(60 * 60 * 6)))
+# Seconds an expired response may still be served while it is refreshed in the background
+OPENEI_STALE_TTL = int(os.getenv('OPENEI_STALE_TTL', str(60 * 60 * 24)))
+# Fraction of OPENEI_CACHE_TTL after which popular entries are refreshed ahead of expiry
+OPENEI_REFRESH_AHEAD = float(os.getenv('OPENEI_REFRESH_AHEAD', '0.8'))
+# Accesses after which an entry counts as popular
+OPENEI_HOT_THRESHOLD = int(os.getenv('OPENEI_HOT_THRESHOLD', '5'))
+# Upper bound on background refresh calls to OpenEI per minute
+OPENEI_REFRESH_BUDGET = float(os.getenv('OPENEI_REFRESH_BUDGET', '30'))
+# OpenEI calls per hour allowed by our API key, shared by all workers (0 disables the throttle)
+OPENEI_HOURLY_QUOTA = float(os.getenv('OPENEI_HOURLY_QUOTA', '1000'))
+
+# Seconds a precomputed quote grid is kept (grids are keyed by tariff content, so they never go stale)
+QUOTE_GRID_TTL = int(os.getenv('QUOTE_GRID_TTL', str(60 * 60 * 24 * 7)))
+# Interpolate between grid points instead of recalculating off-grid inputs
+QUOTE_GRID_INTERPOLATE = os.getenv('QUOTE_GRID_INTERPOLATE', 'false').lower() == 'true'
+
+# Request profiler settings (off unless a staff user sends `X-Profile: 1`)
+PROFILER_SAMPLE_RATE = float(os.getenv('PROFILER_SAMPLE_RATE', '0'))
+PROFILER_SLOW_THRESHOLD_MS = float(os.getenv('PROFILER_SLOW_THRESHOLD_MS')) if os.getenv('PROFILER_SLOW_THRESHOLD_MS') else None
+PROFILER_DIR = Path(os.getenv('PROFILER_DIR', BASE_DIR / 'profiles'))
+PROFILER_MAX_CAPTURES = int(os.getenv('PROFILER_MAX_CAPTURES', '20'))
+# Store redacted JSON bodies of /api/ requests with captures (off so credentials never reach disk)
+PROFILER_CAPTURE_BODIES = os.getenv('PROFILER_CAPTURE_BODIES', 'false').lower() == 'true'
+
+# Bearer token Prometheus sends to /api/metrics/ (empty means only staff users may read metrics)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -53,11 +90,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'app.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'app.middleware.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]